@@ -7,36 +7,39 @@ Este script sirve como punto de entrada principal desde el directorio raíz del
 
 import os
 import sys
-from pathlib import Path
 
 # Agregar el directorio src al path para importar los módulos
-current_dir = Path(__file__).parent
-src_dir = current_dir / "src"
-sys.path.insert(0, str(src_dir))
+import src._bootstrap  # noqa: F401
+
+# --no-color se traduce a la variable estándar NO_COLOR antes de importar el
+# CLI, que decide los colores al cargarse
+if "--no-color" in sys.argv[1:]:
+    os.environ["NO_COLOR"] = "1"
+
+BANNER = "\n".join([
+    "🎯 Sistema de Gestión de Tareas v1.0",
+    "Desarrollado por: Carlos Bermúdez",
+    "=" * 50,
+])
 
 try:
-    from cli.menu_principal import ejecutar_cli
+    from cli.menu_principal import ejecutar_cli, obtener_gestor_activo
 
     def main():
         """
         Función principal del CLI.
         """
         try:
-            print("🎯 Sistema de Gestión de Tareas v1.0")
-            print("Desarrollado por: Carlos Bermúdez")
-            print("=" * 50)
+            print(BANNER)
             ejecutar_cli()
 
         except KeyboardInterrupt:
             print("\n\n🚪 Programa interrumpido por el usuario.")
             from cli.cli_utils import salir_sistema
 
-            # Intentar obtener el gestor para auto-guardar
+            # Reutilizar el gestor de la sesión para auto-guardar
             try:
-                from services.gestor_sistema import GestorSistema
-
-                gestor = GestorSistema()
-                salir_sistema(gestor)
+                salir_sistema(obtener_gestor_activo())
             except Exception:
                 print("¡Hasta pronto!")
                 sys.exit(0)
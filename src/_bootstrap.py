@@ -0,0 +1,16 @@
+"""
+Configuración compartida del path de importación para los puntos de entrada.
+
+Importar este módulo agrega el directorio src al sys.path una única vez,
+de modo que los scripts puedan usar importaciones absolutas como
+``cli``, ``services``, ``models`` y ``utils``.
+"""
+
+import os
+import sys
+
+# Directorio src (donde reside este módulo)
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
@@ -7,13 +7,20 @@ validación, formateo y navegación en el CLI.
 
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Any, List, Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence
 
 from colorama import Back, Fore, Style, init
 
-# Inicializar colorama para colores en terminal
-init(autoreset=True)
+# Sin colores si se define NO_COLOR (https://no-color.org) o si la salida no es
+# un terminal (redirección a archivo, CI, pruebas)
+_USAR_COLORES = not os.environ.get("NO_COLOR") and sys.stdout.isatty()
+
+# Inicializar colorama para colores en terminal. Con autoreset cada escritura
+# termina restableciendo el estilo, por lo que los print() no necesitan un
+# RESET final; solo se mantiene en prompts de input() y en cambios a mitad de línea
+init(autoreset=_USAR_COLORES)
 
 
 class CLIColors:
@@ -38,9 +45,38 @@ class CLIColors:
     RESET = Style.RESET_ALL
 
 
+if not _USAR_COLORES:
+    # Vaciar los colores antes de construir las constantes que los usan
+    for _nombre in [n for n in vars(CLIColors) if n.isupper()]:
+        setattr(CLIColors, _nombre, "")
+    del _nombre
+
+
+# Iconos con color de las tablas de tareas, indexados por el valor del estado
+# y de la prioridad
+_ESTADO_TOKENS = {
+    "completada": CLIColors.SUCCESS + "✅",
+    "en_progreso": CLIColors.WARNING + "⏳",
+    "pendiente": CLIColors.INFO + "📋",
+}
+_PRIO_TOKENS = {
+    "alta": CLIColors.ERROR + "🔴 Alta",
+    "media": CLIColors.WARNING + "🟡 Media",
+    "baja": CLIColors.SUCCESS + "🟢 Baja",
+}
+
+
+# Secuencia ANSI que borra la pantalla y lleva el cursor al inicio; en Windows
+# la traduce colorama
+_SECUENCIA_LIMPIAR = "\x1b[2J\x1b[H"
+
+
 def limpiar_pantalla():
     """Limpia la pantalla del terminal."""
-    os.system("cls" if os.name == "nt" else "clear")
+    if not sys.stdout.isatty():
+        return
+    sys.stdout.write(_SECUENCIA_LIMPIAR)
+    sys.stdout.flush()
 
 
 def pausar():
@@ -48,6 +84,20 @@ def pausar():
     input(f"\n{CLIColors.INFO}Presiona ENTER para continuar...{CLIColors.RESET}")
 
 
+def _imprimir_lineas(lineas: List[str]):
+    """
+    Escribe varias líneas con una sola llamada a print().
+
+    Cada línea termina con RESET, igual que si se imprimiera por separado
+    con el autoreset de colorama, para que los colores no pasen a la
+    siguiente línea.
+
+    Args:
+        lineas (List[str]): Líneas a mostrar
+    """
+    print(f"{CLIColors.RESET}\n".join(lineas))
+
+
 def mostrar_titulo(titulo: str):
     """
     Muestra un título formateado en el CLI.
@@ -55,9 +105,23 @@ def mostrar_titulo(titulo: str):
     Args:
         titulo (str): Título a mostrar
     """
-    print(f"\n{CLIColors.HEADER}{'=' * 60}")
-    print(f"{titulo.center(60)}")
-    print(f"{'=' * 60}{CLIColors.RESET}")
+    _imprimir_lineas(
+        ["", f"{CLIColors.HEADER}{'=' * 60}", titulo.center(60), "=" * 60]
+    )
+
+
+@lru_cache(maxsize=64)
+def _barra_subtitulo(longitud: int) -> str:
+    """
+    Devuelve la línea que subraya un subtítulo de la longitud dada.
+
+    Args:
+        longitud (int): Longitud del subtítulo
+
+    Returns:
+        str: Línea de guiones '─' de esa longitud
+    """
+    return "─" * longitud
 
 
 def mostrar_subtitulo(subtitulo: str):
@@ -67,8 +131,9 @@ def mostrar_subtitulo(subtitulo: str):
     Args:
         subtitulo (str): Subtítulo a mostrar
     """
-    print(f"\n{CLIColors.HEADER}{subtitulo}")
-    print(f"{'─' * len(subtitulo)}{CLIColors.RESET}")
+    _imprimir_lineas(
+        ["", f"{CLIColors.HEADER}{subtitulo}", _barra_subtitulo(len(subtitulo))]
+    )
 
 
 def mostrar_exito(mensaje: str):
@@ -78,7 +143,7 @@ def mostrar_exito(mensaje: str):
     Args:
         mensaje (str): Mensaje de éxito
     """
-    print(f"\n{CLIColors.SUCCESS}✅ {mensaje}{CLIColors.RESET}")
+    print(f"\n{CLIColors.SUCCESS}✅ {mensaje}")
 
 
 def mostrar_error(mensaje: str):
@@ -88,7 +153,7 @@ def mostrar_error(mensaje: str):
     Args:
         mensaje (str): Mensaje de error
     """
-    print(f"\n{CLIColors.ERROR}❌ {mensaje}{CLIColors.RESET}")
+    print(f"\n{CLIColors.ERROR}❌ {mensaje}")
 
 
 def mostrar_advertencia(mensaje: str):
@@ -98,7 +163,7 @@ def mostrar_advertencia(mensaje: str):
     Args:
         mensaje (str): Mensaje de advertencia
     """
-    print(f"\n{CLIColors.WARNING}⚠️ {mensaje}{CLIColors.RESET}")
+    print(f"\n{CLIColors.WARNING}⚠️ {mensaje}")
 
 
 def mostrar_info(mensaje: str):
@@ -108,7 +173,7 @@ def mostrar_info(mensaje: str):
     Args:
         mensaje (str): Mensaje informativo
     """
-    print(f"\n{CLIColors.INFO}ℹ️ {mensaje}{CLIColors.RESET}")
+    print(f"\n{CLIColors.INFO}ℹ️ {mensaje}")
 
 
 def solicitar_entrada(prompt: str, valor_por_defecto: str = None) -> str:
@@ -125,11 +190,10 @@ def solicitar_entrada(prompt: str, valor_por_defecto: str = None) -> str:
     if valor_por_defecto:
         entrada = input(
             f"{CLIColors.INFO}{prompt} [{valor_por_defecto}]: {CLIColors.RESET}"
-        )
-        return entrada.strip() if entrada.strip() else valor_por_defecto
+        ).strip()
+        return entrada or valor_por_defecto
     else:
-        entrada = input(f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}")
-        return entrada.strip()
+        return input(f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}").strip()
 
 
 def solicitar_entrada_requerida(prompt: str) -> str:
@@ -142,8 +206,9 @@ def solicitar_entrada_requerida(prompt: str) -> str:
     Returns:
         str: Valor ingresado por el usuario
     """
+    texto_prompt = f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}"
     while True:
-        entrada = input(f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}").strip()
+        entrada = input(texto_prompt).strip()
         if entrada:
             return entrada
         mostrar_error("Este campo no puede estar vacío. Intenta nuevamente.")
@@ -161,9 +226,17 @@ def solicitar_numero(prompt: str, minimo: int = 1, maximo: int = None) -> int:
     Returns:
         int: Número ingresado por el usuario
     """
+    texto_prompt = f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}"
     while True:
         try:
-            entrada = input(f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}")
+            entrada = input(texto_prompt).strip()
+
+            # Descartar sin excepción lo que no es un entero (p. ej. letras)
+            digitos = entrada[1:] if entrada[:1] in ("+", "-") else entrada
+            if not digitos.isdigit():
+                mostrar_error("Por favor ingresa un número válido")
+                continue
+
             numero = int(entrada)
 
             if numero < minimo:
@@ -180,6 +253,40 @@ def solicitar_numero(prompt: str, minimo: int = 1, maximo: int = None) -> int:
             mostrar_error("Por favor ingresa un número válido")
 
 
+def _parse_ddmmyyyy(texto: str) -> Optional[datetime]:
+    """
+    Interpreta una fecha DD/MM/YYYY sin pasar por strptime.
+
+    Solo acepta la forma estricta (día y mes de 1 o 2 dígitos, año de 4);
+    cualquier otra entrada devuelve None para que el llamador recurra a
+    strptime.
+
+    Args:
+        texto (str): Fecha en formato DD/MM/YYYY
+
+    Returns:
+        Optional[datetime]: Fecha interpretada, o None si no se pudo
+    """
+    partes = texto.split("/")
+    if len(partes) != 3:
+        return None
+
+    dia, mes, anio = partes
+    if not (
+        0 < len(dia) <= 2
+        and 0 < len(mes) <= 2
+        and len(anio) == 4
+        and (dia + mes + anio).isascii()
+        and (dia + mes + anio).isdigit()
+    ):
+        return None
+
+    try:
+        return datetime(int(anio), int(mes), int(dia))
+    except ValueError:
+        return None
+
+
 def solicitar_fecha(prompt: str, permitir_vacia: bool = False) -> Optional[datetime]:
     """
     Solicita una fecha del usuario con validación.
@@ -191,12 +298,12 @@ def solicitar_fecha(prompt: str, permitir_vacia: bool = False) -> Optional[datet
     Returns:
         datetime: Fecha ingresada por el usuario
     """
-    print(
-        f"\n{CLIColors.INFO}Formato de fecha: DD/MM/YYYY (ej: 25/12/2025){CLIColors.RESET}"
-    )
+    print(f"\n{CLIColors.INFO}Formato de fecha: DD/MM/YYYY (ej: 25/12/2025)")
+    hoy = datetime.now().date()
+    texto_prompt = f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}"
 
     while True:
-        entrada = input(f"{CLIColors.INFO}{prompt}: {CLIColors.RESET}").strip()
+        entrada = input(texto_prompt).strip()
 
         if not entrada and permitir_vacia:
             return None
@@ -207,10 +314,12 @@ def solicitar_fecha(prompt: str, permitir_vacia: bool = False) -> Optional[datet
 
         try:
             # Intentar parsear la fecha
-            fecha = datetime.strptime(entrada, "%d/%m/%Y")
+            fecha = _parse_ddmmyyyy(entrada) or datetime.strptime(
+                entrada, "%d/%m/%Y"
+            )
 
             # Validar que la fecha sea futura (para fechas límite) solo si no permite vacía
-            if not permitir_vacia and fecha.date() <= datetime.now().date():
+            if not permitir_vacia and fecha.date() <= hoy:
                 mostrar_error("La fecha debe ser futura")
                 continue
 
@@ -220,6 +329,11 @@ def solicitar_fecha(prompt: str, permitir_vacia: bool = False) -> Optional[datet
             mostrar_error("Formato de fecha inválido. Usa DD/MM/YYYY")
 
 
+# Respuestas aceptadas por confirmar_accion
+_RESPUESTAS_SI = frozenset(("s", "sí", "si", "y", "yes"))
+_RESPUESTAS_NO = frozenset(("n", "no"))
+
+
 def confirmar_accion(mensaje: str) -> bool:
     """
     Solicita confirmación del usuario para una acción.
@@ -230,26 +344,23 @@ def confirmar_accion(mensaje: str) -> bool:
     Returns:
         bool: True si confirma, False si no
     """
+    texto_prompt = f"{CLIColors.WARNING}{mensaje} (s/n): {CLIColors.RESET}"
     while True:
-        respuesta = (
-            input(f"{CLIColors.WARNING}{mensaje} (s/n): {CLIColors.RESET}")
-            .strip()
-            .lower()
-        )
-        if respuesta in ["s", "sí", "si", "y", "yes"]:
+        respuesta = input(texto_prompt).strip().lower()
+        if respuesta in _RESPUESTAS_SI:
             return True
-        elif respuesta in ["n", "no"]:
+        elif respuesta in _RESPUESTAS_NO:
             return False
         else:
             mostrar_error("Por favor responde 's' para sí o 'n' para no")
 
 
-def mostrar_menu_opciones(opciones: List[str], titulo: str = "OPCIONES") -> int:
+def mostrar_menu_opciones(opciones: Sequence[str], titulo: str = "OPCIONES") -> int:
     """
     Muestra un menú de opciones y solicita selección.
 
     Args:
-        opciones (List[str]): Lista de opciones
+        opciones (Sequence[str]): Lista o tupla de opciones
         titulo (str): Título del menú
 
     Returns:
@@ -263,6 +374,39 @@ def mostrar_menu_opciones(opciones: List[str], titulo: str = "OPCIONES") -> int:
     return solicitar_numero(f"\nSelecciona una opción", minimo=1, maximo=len(opciones))
 
 
+# Nombres de los meses indexados por número de mes (el índice 0 no se usa)
+_MESES = (
+    "",
+    "enero",
+    "febrero",
+    "marzo",
+    "abril",
+    "mayo",
+    "junio",
+    "julio",
+    "agosto",
+    "septiembre",
+    "octubre",
+    "noviembre",
+    "diciembre",
+)
+
+
+@lru_cache(maxsize=1024)
+def _formatear_ordinal(ordinal: int) -> str:
+    """
+    Formatea en texto legible el día con el ordinal dado, con caché.
+
+    Args:
+        ordinal (int): Ordinal gregoriano de la fecha (date.toordinal())
+
+    Returns:
+        str: Fecha formateada legiblemente
+    """
+    fecha = date.fromordinal(ordinal)
+    return f"{fecha.day} de {_MESES[fecha.month]} de {fecha.year}"
+
+
 def formatear_fecha_legible(fecha: datetime) -> str:
     """
     Formatea una fecha en formato legible.
@@ -273,37 +417,26 @@ def formatear_fecha_legible(fecha: datetime) -> str:
     Returns:
         str: Fecha formateada legiblemente
     """
-    meses = {
-        1: "enero",
-        2: "febrero",
-        3: "marzo",
-        4: "abril",
-        5: "mayo",
-        6: "junio",
-        7: "julio",
-        8: "agosto",
-        9: "septiembre",
-        10: "octubre",
-        11: "noviembre",
-        12: "diciembre",
-    }
+    return _formatear_ordinal(fecha.toordinal())
 
-    return f"{fecha.day} de {meses[fecha.month]} de {fecha.year}"
 
-
-def calcular_dias_restantes(fecha_limite: datetime) -> tuple:
+def calcular_dias_restantes(
+    fecha_limite: datetime, ahora: Optional[datetime] = None
+) -> tuple:
     """
     Calcula los días restantes hasta una fecha límite.
 
     Args:
         fecha_limite (datetime): Fecha límite
+        ahora (Optional[datetime]): Momento de referencia; por defecto la hora
+            actual. Al mostrar una tabla se pasa el mismo valor para todas las filas.
 
     Returns:
         tuple: (días_restantes, es_critica, mensaje_color)
     """
-    ahora = datetime.now()
-    diferencia = fecha_limite - ahora
-    dias = diferencia.days
+    if ahora is None:
+        ahora = datetime.now()
+    dias = (fecha_limite - ahora).days
 
     if dias < 0:
         return dias, True, CLIColors.ERROR  # Vencida
@@ -320,18 +453,19 @@ def mostrar_estadisticas_sistema(stats: dict):
     Args:
         stats (dict): Diccionario con estadísticas
     """
-    print(f"\n{CLIColors.HEADER}📊 Estado actual del sistema:")
-    print(f"{CLIColors.USER}• Usuarios: {stats.get('total_usuarios', 0)}")
-    print(f"{CLIColors.TASK}• Tareas totales: {stats.get('total_tareas', 0)}")
-
     pendientes = stats.get("tareas_pendientes", 0)
     progreso = stats.get("tareas_en_progreso", 0)
     completadas = stats.get("tareas_completadas", 0)
 
-    print(f"{CLIColors.WARNING}• Pendientes: {pendientes} | ", end="")
-    print(f"{CLIColors.INFO}En progreso: {progreso} | ", end="")
-    print(f"{CLIColors.SUCCESS}Completadas: {completadas}")
-    print(f"{CLIColors.RESET}")
+    # Una sola escritura para todo el bloque
+    print(
+        f"\n{CLIColors.HEADER}📊 Estado actual del sistema:\n"
+        f"{CLIColors.USER}• Usuarios: {stats.get('total_usuarios', 0)}\n"
+        f"{CLIColors.TASK}• Tareas totales: {stats.get('total_tareas', 0)}\n"
+        f"{CLIColors.WARNING}• Pendientes: {pendientes} | "
+        f"{CLIColors.INFO}En progreso: {progreso} | "
+        f"{CLIColors.SUCCESS}Completadas: {completadas}\n"
+    )
 
 
 def manejar_error_sistema(error: Exception):
@@ -343,7 +477,7 @@ def manejar_error_sistema(error: Exception):
     """
     mostrar_error(f"Error del sistema: {str(error)}")
     print(
-        f"\n{CLIColors.INFO}Si el error persiste, contacta al administrador del sistema.{CLIColors.RESET}"
+        f"\n{CLIColors.INFO}Si el error persiste, contacta al administrador del sistema."
     )
     pausar()
 
@@ -356,39 +490,36 @@ def salir_sistema(gestor=None):
     # Auto-guardado antes de salir
     if gestor:
         try:
-            print(
-                f"{CLIColors.INFO}💾 Guardando cambios automáticamente...{CLIColors.RESET}"
-            )
+            print(f"{CLIColors.INFO}💾 Guardando cambios automáticamente...")
             if gestor.guardar_datos_sistema("json"):
-                print(
-                    f"{CLIColors.SUCCESS}✅ Datos guardados exitosamente{CLIColors.RESET}"
-                )
+                print(f"{CLIColors.SUCCESS}✅ Datos guardados exitosamente")
             else:
-                print(
-                    f"{CLIColors.WARNING}⚠️ No se pudieron guardar algunos datos{CLIColors.RESET}"
-                )
+                print(f"{CLIColors.WARNING}⚠️ No se pudieron guardar algunos datos")
         except Exception as e:
-            print(f"{CLIColors.ERROR}❌ Error al guardar: {str(e)}{CLIColors.RESET}")
+            print(f"{CLIColors.ERROR}❌ Error al guardar: {str(e)}")
             respuesta = input(
                 f"{CLIColors.WARNING}¿Salir sin guardar? (s/N): {CLIColors.RESET}"
             )
             if respuesta.lower() != "s":
                 return False  # No salir
 
-    print(
-        f"\n{CLIColors.SUCCESS}✅ Gracias por usar el Sistema de Gestión de Tareas{CLIColors.RESET}"
-    )
-    print(f"{CLIColors.INFO}Desarrollado por: Carlos Bermúdez{CLIColors.RESET}")
+    print(f"\n{CLIColors.SUCCESS}✅ Gracias por usar el Sistema de Gestión de Tareas")
+    print(f"{CLIColors.INFO}Desarrollado por: Carlos Bermúdez")
     sys.exit(0)
 
 
+_ENCABEZADO_PRINCIPAL = (
+    f"{CLIColors.HEADER}\n{CLIColors.RESET}"
+    "🎯 SISTEMA DE GESTIÓN DE TAREAS v1.0\n"
+    "==========================================\n"
+    f"{CLIColors.INFO}Desarrollado por: Carlos Bermúdez"
+)
+
+
 def mostrar_encabezado_principal():
     """Muestra el encabezado principal del sistema."""
     limpiar_pantalla()
-    print(f"{CLIColors.HEADER}")
-    print("🎯 SISTEMA DE GESTIÓN DE TAREAS v1.0")
-    print("==========================================")
-    print(f"{CLIColors.INFO}Desarrollado por: Carlos Bermúdez{CLIColors.RESET}")
+    print(_ENCABEZADO_PRINCIPAL)
 
 
 def mostrar_tabla_tareas(tareas: List[Any]):
@@ -402,42 +533,40 @@ def mostrar_tabla_tareas(tareas: List[Any]):
         mostrar_info("No hay tareas para mostrar")
         return
 
-    print(f"\n{CLIColors.HEADER}📋 LISTA DE TAREAS:{CLIColors.RESET}")
-    print(f"{CLIColors.HEADER}{'─' * 80}{CLIColors.RESET}")
+    lineas = [
+        "",
+        f"{CLIColors.HEADER}📋 LISTA DE TAREAS:",
+        f"{CLIColors.HEADER}{'─' * 80}",
+    ]
+
+    numero_color = CLIColors.NUMBER
+    reset = CLIColors.RESET
+    estado_tokens = _ESTADO_TOKENS
+    prio_tokens = _PRIO_TOKENS
+    agregar = lineas.append
+    ahora = datetime.now()
 
     for i, tarea in enumerate(tareas, 1):
         # Estado con color (manejar tanto string como Enum)
-        estado_valor = (
-            tarea.estado.value if hasattr(tarea.estado, "value") else tarea.estado
-        )
+        estado_valor = getattr(tarea.estado, "value", tarea.estado)
+        estado_color = estado_tokens.get(estado_valor, estado_tokens["pendiente"])
 
-        if estado_valor == "completada":
-            estado_color = CLIColors.SUCCESS + "✅"
-        elif estado_valor == "en_progreso":
-            estado_color = CLIColors.WARNING + "⏳"
-        else:
-            estado_color = CLIColors.INFO + "📋"
+        # Prioridad con color (Tarea siempre la define, "baja" por defecto)
+        prioridad_color = prio_tokens.get(tarea.prioridad, prio_tokens["baja"])
 
-        # Prioridad con color (manejar tanto string como atributo)
-        prioridad_valor = tarea.prioridad if hasattr(tarea, "prioridad") else "baja"
-
-        if prioridad_valor == "alta":
-            prioridad_color = CLIColors.ERROR + "🔴 Alta"
-        elif prioridad_valor == "media":
-            prioridad_color = CLIColors.WARNING + "🟡 Media"
-        else:
-            prioridad_color = CLIColors.SUCCESS + "🟢 Baja"
-
-        print(
-            f"{CLIColors.NUMBER}{i:2}.{CLIColors.RESET} {estado_color} {tarea.titulo[:40]:40} {prioridad_color}{CLIColors.RESET}"
+        titulo = tarea.titulo[:40].ljust(40)
+        agregar(
+            f"{numero_color}{i:2}.{reset} {estado_color} {titulo} {prioridad_color}"
         )
         if tarea.fecha_limite:
-            dias, es_critica, color = calcular_dias_restantes(tarea.fecha_limite)
+            dias, es_critica, color = calcular_dias_restantes(tarea.fecha_limite, ahora)
             if dias >= 0:
-                print(f"    📅 Vence en {color}{dias} días{CLIColors.RESET}")
+                agregar(f"    📅 Vence en {color}{dias} días")
             else:
-                print(f"    📅 {color}Vencida hace {abs(dias)} días{CLIColors.RESET}")
-        print()
+                agregar(f"    📅 {color}Vencida hace {abs(dias)} días")
+        agregar("")
+
+    _imprimir_lineas(lineas)
 
 
 def mostrar_tabla_usuarios(usuarios: List[Any]):
@@ -451,13 +580,23 @@ def mostrar_tabla_usuarios(usuarios: List[Any]):
         mostrar_info("No hay usuarios para mostrar")
         return
 
-    print(f"\n{CLIColors.HEADER}👥 LISTA DE USUARIOS:{CLIColors.RESET}")
-    print(f"{CLIColors.HEADER}{'─' * 60}{CLIColors.RESET}")
+    lineas = [
+        "",
+        f"{CLIColors.HEADER}👥 LISTA DE USUARIOS:",
+        f"{CLIColors.HEADER}{'─' * 60}",
+    ]
+
+    numero_color = CLIColors.NUMBER
+    usuario_color = CLIColors.USER
+    info_color = CLIColors.INFO
+    reset = CLIColors.RESET
 
     for i, usuario in enumerate(usuarios, 1):
-        print(
-            f"{CLIColors.NUMBER}{i:2}.{CLIColors.RESET} {CLIColors.USER}{usuario.nombre:25}{CLIColors.RESET} {CLIColors.INFO}({usuario.email}){CLIColors.RESET}"
+        lineas += (
+            f"{numero_color}{i:2}.{reset} {usuario_color}{usuario.nombre.ljust(25)}{reset} {info_color}({usuario.email})",
+            f"    📧 {usuario.email}",
+            f"    📱 {usuario.telefono or 'No especificado'}",
+            "",
         )
-        print(f"    📧 {usuario.email}")
-        print(f"    📱 {usuario.telefono or 'No especificado'}")
-        print()
+
+    _imprimir_lineas(lineas)
@@ -7,7 +7,6 @@ de gestión de tareas desde línea de comandos.
 
 import sys
 import os
-from pathlib import Path
 from menu_principal import ejecutar_cli
 
 
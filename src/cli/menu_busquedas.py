@@ -5,6 +5,8 @@ Este módulo contiene toda la lógica para realizar búsquedas
 avanzadas y aplicar filtros en el sistema.
 """
 
+from datetime import datetime, timedelta
+from itertools import islice
 from typing import List
 
 # Importaciones usando try/except para manejar diferentes contextos
@@ -24,6 +26,26 @@ except ImportError:
     )
 
 
+# Máximo de tareas que se listan en una búsqueda por criterio
+_MAX_RESULTADOS_MOSTRADOS = 50
+
+# Longitud mínima del término en las búsquedas de texto libre
+_MIN_LONGITUD_TERMINO = 2
+
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "🔍 Búsqueda general",
+    "📋 Buscar tareas por criterio",
+    "👥 Buscar usuarios",
+    "⏰ Tareas próximas a vencer",
+    "🚫 Tareas vencidas",
+    "📊 Filtros por estado",
+    "🎯 Filtros por prioridad",
+    "👤 Tareas por usuario específico",
+    "⬅️ Volver al menú principal",
+)
+
+
 class MenuBusquedas:
     """
     Clase que maneja el menú de búsquedas y filtros.
@@ -44,20 +66,8 @@ class MenuBusquedas:
         """
         while True:
             try:
-                opciones = [
-                    "🔍 Búsqueda general",
-                    "📋 Buscar tareas por criterio",
-                    "👥 Buscar usuarios",
-                    "⏰ Tareas próximas a vencer",
-                    "🚫 Tareas vencidas",
-                    "📊 Filtros por estado",
-                    "🎯 Filtros por prioridad",
-                    "👤 Tareas por usuario específico",
-                    "⬅️ Volver al menú principal"
-                ]
-                
                 mostrar_titulo("BÚSQUEDAS Y FILTROS")
-                seleccion = mostrar_menu_opciones(opciones)
+                seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
                 
                 if seleccion == 1:
                     self.busqueda_general()
@@ -83,299 +93,272 @@ class MenuBusquedas:
     
     def busqueda_general(self):
         """Realiza búsqueda general en el sistema."""
-        try:
-            mostrar_titulo("BÚSQUEDA GENERAL")
-            
-            termino = solicitar_entrada_requerida("Término de búsqueda")
-            
-            # Buscar en tareas
-            tareas_encontradas = self.gestor.buscar_tareas(termino)
-            
-            # Buscar en usuarios
-            usuarios_encontrados = []
-            for usuario in self.gestor.usuarios:
-                if (termino.lower() in usuario.nombre.lower() or 
-                    termino.lower() in usuario.email.lower()):
-                    usuarios_encontrados.append(usuario)
-            
-            # Mostrar resultados
-            total_resultados = len(tareas_encontradas) + len(usuarios_encontrados)
-            
-            if total_resultados == 0:
-                mostrar_advertencia(f"No se encontraron resultados para: '{termino}'")
-            else:
-                mostrar_subtitulo(f"Resultados de búsqueda ({total_resultados} encontrados)")
-                
-                if tareas_encontradas:
-                    print(f"\n📋 TAREAS ENCONTRADAS ({len(tareas_encontradas)}):")
-                    mostrar_tabla_tareas(tareas_encontradas)
-                
-                if usuarios_encontrados:
-                    print(f"\n👥 USUARIOS ENCONTRADOS ({len(usuarios_encontrados)}):")
-                    mostrar_tabla_usuarios(usuarios_encontrados)
-            
+        mostrar_titulo("BÚSQUEDA GENERAL")
+        
+        termino = solicitar_entrada_requerida("Término de búsqueda")
+
+        if len(termino) < _MIN_LONGITUD_TERMINO:
+            mostrar_advertencia(f"Introduce al menos {_MIN_LONGITUD_TERMINO} caracteres")
             pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+            return
+        
+        # Buscar en tareas
+        tareas_encontradas = self.gestor.buscar_tareas(termino)
+        
+        # Buscar en usuarios
+        usuarios_encontrados = self.gestor.buscar_usuarios(termino)
+        
+        # Mostrar resultados
+        total_resultados = len(tareas_encontradas) + len(usuarios_encontrados)
+        
+        if total_resultados == 0:
+            mostrar_advertencia(f"No se encontraron resultados para: '{termino}'")
+        else:
+            mostrar_subtitulo(f"Resultados de búsqueda ({total_resultados} encontrados)")
+            
+            if tareas_encontradas:
+                print(f"\n📋 TAREAS ENCONTRADAS ({len(tareas_encontradas)}):")
+                mostrar_tabla_tareas(tareas_encontradas)
+            
+            if usuarios_encontrados:
+                print(f"\n👥 USUARIOS ENCONTRADOS ({len(usuarios_encontrados)}):")
+                mostrar_tabla_usuarios(usuarios_encontrados)
+        
+        pausar()
     
     def buscar_tareas_por_criterio(self):
         """Busca tareas usando diferentes criterios."""
-        try:
-            mostrar_titulo("BUSCAR TAREAS POR CRITERIO")
-            
-            criterios = [
-                "📝 Por título",
-                "📄 Por descripción",
-                "📅 Por fecha de creación",
-                "⏰ Por fecha límite",
-                "🔍 Búsqueda combinada"
-            ]
-            
-            criterio_seleccion = mostrar_menu_opciones(criterios, "CRITERIO DE BÚSQUEDA")
-            
-            resultados = []
-            
-            if criterio_seleccion == 1:
-                # Búsqueda por título
-                termino = solicitar_entrada_requerida("Término en el título")
-                resultados = [t for t in self.gestor.tareas if termino.lower() in t.titulo.lower()]
-                
-            elif criterio_seleccion == 2:
-                # Búsqueda por descripción
-                termino = solicitar_entrada_requerida("Término en la descripción")
-                resultados = [t for t in self.gestor.tareas 
-                            if t.descripcion and termino.lower() in t.descripcion.lower()]
-                
-            elif criterio_seleccion == 3:
-                # Por fecha de creación (hoy, ayer, esta semana)
-                opciones_fecha = ["📅 Hoy", "📆 Ayer", "📊 Esta semana"]
-                fecha_seleccion = mostrar_menu_opciones(opciones_fecha, "PERÍODO")
-                
-                from datetime import datetime, timedelta
-                hoy = datetime.now().date()
-                
-                if fecha_seleccion == 1:  # Hoy
-                    resultados = [t for t in self.gestor.tareas if t.fecha_creacion.date() == hoy]
-                elif fecha_seleccion == 2:  # Ayer
-                    ayer = hoy - timedelta(days=1)
-                    resultados = [t for t in self.gestor.tareas if t.fecha_creacion.date() == ayer]
-                elif fecha_seleccion == 3:  # Esta semana
-                    inicio_semana = hoy - timedelta(days=hoy.weekday())
-                    resultados = [t for t in self.gestor.tareas 
-                                if t.fecha_creacion.date() >= inicio_semana]
-                
-            elif criterio_seleccion == 4:
-                # Por fecha límite próxima
-                from datetime import datetime, timedelta
-                dias_adelante = 7  # Por defecto 7 días
-                fecha_limite = datetime.now() + timedelta(days=dias_adelante)
-                resultados = [t for t in self.gestor.tareas 
-                            if t.fecha_limite and t.fecha_limite <= fecha_limite]
-                
-            elif criterio_seleccion == 5:
-                # Búsqueda combinada
-                termino = solicitar_entrada_requerida("Término general")
-                resultados = self.gestor.buscar_tareas(termino)
-            
-            if resultados:
-                mostrar_subtitulo(f"Resultados encontrados ({len(resultados)} tareas)")
-                mostrar_tabla_tareas(resultados)
-            else:
-                mostrar_advertencia("No se encontraron tareas que coincidan con el criterio")
-            
-            pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+        mostrar_titulo("BUSCAR TAREAS POR CRITERIO")
+        
+        criterios = [
+            "📝 Por título",
+            "📄 Por descripción",
+            "📅 Por fecha de creación",
+            "⏰ Por fecha límite",
+            "🔍 Búsqueda combinada"
+        ]
+        
+        criterio_seleccion = mostrar_menu_opciones(criterios, "CRITERIO DE BÚSQUEDA")
+        
+        # Los criterios producen generadores; solo se materializa lo que se muestra
+        resultados = iter(())
+        
+        if criterio_seleccion == 1:
+            # Búsqueda por título
+            termino_lower = solicitar_entrada_requerida("Término en el título").lower()
+            resultados = (t for t in self.gestor.tareas if termino_lower in t.titulo_lower)
+            
+        elif criterio_seleccion == 2:
+            # Búsqueda por descripción
+            termino_lower = solicitar_entrada_requerida("Término en la descripción").lower()
+            resultados = (t for t in self.gestor.tareas if termino_lower in t.descripcion_lower)
+            
+        elif criterio_seleccion == 3:
+            # Por fecha de creación (hoy, ayer, esta semana)
+            opciones_fecha = ["📅 Hoy", "📆 Ayer", "📊 Esta semana"]
+            fecha_seleccion = mostrar_menu_opciones(opciones_fecha, "PERÍODO")
+            
+            hoy = datetime.now().date()
+            
+            if fecha_seleccion == 1:  # Hoy
+                resultados = (t for t in self.gestor.tareas if t.fecha_creacion_dia == hoy)
+            elif fecha_seleccion == 2:  # Ayer
+                ayer = hoy - timedelta(days=1)
+                resultados = (t for t in self.gestor.tareas if t.fecha_creacion_dia == ayer)
+            elif fecha_seleccion == 3:  # Esta semana
+                inicio_semana = hoy - timedelta(days=hoy.weekday())
+                resultados = (t for t in self.gestor.tareas 
+                            if t.fecha_creacion_dia >= inicio_semana)
+            
+        elif criterio_seleccion == 4:
+            # Por fecha límite próxima
+            dias_adelante = 7  # Por defecto 7 días
+            fecha_limite = datetime.now() + timedelta(days=dias_adelante)
+            resultados = (t for t in self.gestor.tareas 
+                        if t.fecha_limite and t.fecha_limite <= fecha_limite)
+            
+        elif criterio_seleccion == 5:
+            # Búsqueda combinada
+            termino = solicitar_entrada_requerida("Término general")
+            resultados = self.gestor.buscar_tareas(termino)
+        
+        # Tomar uno más del máximo para saber si hay resultados sin mostrar
+        resultados = list(islice(resultados, _MAX_RESULTADOS_MOSTRADOS + 1))
+        
+        if len(resultados) > _MAX_RESULTADOS_MOSTRADOS:
+            mostrar_subtitulo(
+                f"Más de {_MAX_RESULTADOS_MOSTRADOS} tareas encontradas; "
+                f"se muestran las primeras {_MAX_RESULTADOS_MOSTRADOS}"
+            )
+            mostrar_tabla_tareas(resultados[:_MAX_RESULTADOS_MOSTRADOS])
+        elif resultados:
+            mostrar_subtitulo(f"Resultados encontrados ({len(resultados)} tareas)")
+            mostrar_tabla_tareas(resultados)
+        else:
+            mostrar_advertencia("No se encontraron tareas que coincidan con el criterio")
+        
+        pausar()
     
     def buscar_usuarios(self):
         """Busca usuarios específicos."""
-        try:
-            mostrar_titulo("BUSCAR USUARIOS")
-            
-            termino = solicitar_entrada_requerida("Término de búsqueda (nombre o email)")
-            
-            resultados = []
-            for usuario in self.gestor.usuarios:
-                if (termino.lower() in usuario.nombre.lower() or 
-                    termino.lower() in usuario.email.lower()):
-                    resultados.append(usuario)
-            
-            if resultados:
-                mostrar_subtitulo(f"Usuarios encontrados ({len(resultados)})")
-                mostrar_tabla_usuarios(resultados)
-                
-                # Mostrar tareas de cada usuario encontrado
-                for usuario in resultados:
-                    tareas_usuario = [t for t in self.gestor.tareas if t.usuario_id == usuario.id]
-                    print(f"\n📋 Tareas de {usuario.nombre}: {len(tareas_usuario)}")
-                    if tareas_usuario:
-                        pendientes = len([t for t in tareas_usuario if t.estado.value == 'pendiente'])
-                        en_progreso = len([t for t in tareas_usuario if t.estado.value == 'en_progreso'])
-                        completadas = len([t for t in tareas_usuario if t.estado.value == 'completada'])
-                        print(f"  • Pendientes: {pendientes} | En progreso: {en_progreso} | Completadas: {completadas}")
-            else:
-                mostrar_advertencia("No se encontraron usuarios que coincidan con la búsqueda")
-            
+        mostrar_titulo("BUSCAR USUARIOS")
+        
+        termino = solicitar_entrada_requerida("Término de búsqueda (nombre o email)")
+
+        if len(termino) < _MIN_LONGITUD_TERMINO:
+            mostrar_advertencia(f"Introduce al menos {_MIN_LONGITUD_TERMINO} caracteres")
             pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+            return
+        
+        resultados = self.gestor.buscar_usuarios(termino)
+        
+        if resultados:
+            mostrar_subtitulo(f"Usuarios encontrados ({len(resultados)})")
+            mostrar_tabla_usuarios(resultados)
+            
+            # Mostrar tareas de cada usuario encontrado (conteos en caché del gestor)
+            for usuario in resultados:
+                conteo = self.gestor.contar_tareas_por_estado(usuario.id)
+                print(f"\n📋 Tareas de {usuario.nombre}: {sum(conteo.values())}")
+                if conteo:
+                    print(f"  • Pendientes: {conteo['pendiente']} | En progreso: {conteo['en_progreso']} | Completadas: {conteo['completada']}")
+        else:
+            mostrar_advertencia("No se encontraron usuarios que coincidan con la búsqueda")
+        
+        pausar()
     
     def tareas_proximas_vencer(self):
         """Muestra tareas próximas a vencer."""
-        try:
-            mostrar_titulo("TAREAS PRÓXIMAS A VENCER")
-            
-            # Obtener tareas próximas a vencer (próximos 7 días por defecto)
-            tareas_proximas = list(self.gestor.obtener_tareas_proximas_vencer(7))
-            
-            if tareas_proximas:
-                mostrar_subtitulo(f"Tareas que vencen en los próximos 7 días ({len(tareas_proximas)})")
-                mostrar_tabla_tareas(tareas_proximas)
-                
-                # Mostrar detalles adicionales
-                print(f"\n📊 ANÁLISIS:")
-                criticas = [t for t in tareas_proximas 
-                          if t.fecha_limite and (t.fecha_limite - self.gestor.obtener_estadisticas_sistema()['fecha_consulta']).days <= 3]
-                print(f"  • Tareas críticas (≤3 días): {len(criticas)}")
-                
-            else:
-                mostrar_advertencia("No hay tareas próximas a vencer en los próximos 7 días")
+        mostrar_titulo("TAREAS PRÓXIMAS A VENCER")
+        
+        # Obtener tareas próximas a vencer (próximos 7 días por defecto)
+        tareas_proximas = tuple(self.gestor.obtener_tareas_proximas_vencer(7))
+        
+        if tareas_proximas:
+            mostrar_subtitulo(f"Tareas que vencen en los próximos 7 días ({len(tareas_proximas)})")
+            mostrar_tabla_tareas(tareas_proximas)
             
-            pausar()
+            # Mostrar detalles adicionales
+            print(f"\n📊 ANÁLISIS:")
+            ahora = datetime.now()
+            criticas = sum(1 for t in tareas_proximas
+                           if t.fecha_limite and (t.fecha_limite - ahora).days <= 3)
+            print(f"  • Tareas críticas (≤3 días): {criticas}")
             
-        except Exception as e:
-            manejar_error_sistema(e)
+        else:
+            mostrar_advertencia("No hay tareas próximas a vencer en los próximos 7 días")
+        
+        pausar()
     
     def tareas_vencidas(self):
         """Muestra tareas vencidas."""
-        try:
-            mostrar_titulo("TAREAS VENCIDAS")
-            
-            from datetime import datetime
-            ahora = datetime.now()
-            
-            tareas_vencidas = [t for t in self.gestor.tareas 
-                             if t.fecha_limite and t.fecha_limite < ahora and t.estado.value != 'completada']
-            
-            if tareas_vencidas:
-                mostrar_subtitulo(f"Tareas vencidas ({len(tareas_vencidas)})")
-                mostrar_tabla_tareas(tareas_vencidas)
-                
-                # Mostrar análisis de días vencidos
-                print(f"\n📊 ANÁLISIS DE VENCIMIENTOS:")
-                for tarea in tareas_vencidas:
-                    dias_vencida = (ahora - tarea.fecha_limite).days
-                    print(f"  • {tarea.titulo[:30]:30} - Vencida hace {dias_vencida} días")
-                
-            else:
-                mostrar_exito("¡No hay tareas vencidas! 🎉")
-            
-            pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+        mostrar_titulo("TAREAS VENCIDAS")
+        
+        ahora = datetime.now()
+        
+        tareas_vencidas = list(self.gestor.obtener_tareas_vencidas(ahora))
+        
+        if tareas_vencidas:
+            mostrar_subtitulo(f"Tareas vencidas ({len(tareas_vencidas)})")
+            mostrar_tabla_tareas(tareas_vencidas)
+            
+            # Mostrar análisis de días vencidos
+            print(f"\n📊 ANÁLISIS DE VENCIMIENTOS:")
+            for tarea in tareas_vencidas:
+                dias_vencida = (ahora - tarea.fecha_limite).days
+                print(f"  • {tarea.titulo_corto:30} - Vencida hace {dias_vencida} días")
+            
+        else:
+            mostrar_exito("¡No hay tareas vencidas! 🎉")
+        
+        pausar()
     
     def filtrar_por_estado(self):
         """Filtra tareas por estado."""
-        try:
-            mostrar_titulo("FILTRAR POR ESTADO")
-            
-            estados = ["📋 Pendientes", "⏳ En progreso", "✅ Completadas"]
-            estado_seleccion = mostrar_menu_opciones(estados, "ESTADO")
-            
-            estados_map = ["pendiente", "en_progreso", "completada"]
-            estado_filtro = estados_map[estado_seleccion - 1]
-            
-            tareas_filtradas = list(self.gestor.listar_tareas_por_estado(estado_filtro))
-            
-            if tareas_filtradas:
-                mostrar_subtitulo(f"Tareas {estado_filtro.replace('_', ' ')} ({len(tareas_filtradas)})")
-                mostrar_tabla_tareas(tareas_filtradas)
-            else:
-                mostrar_advertencia(f"No hay tareas en estado: {estado_filtro.replace('_', ' ')}")
-            
-            pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+        mostrar_titulo("FILTRAR POR ESTADO")
+        
+        estados = ["📋 Pendientes", "⏳ En progreso", "✅ Completadas"]
+        estado_seleccion = mostrar_menu_opciones(estados, "ESTADO")
+        
+        estados_map = ["pendiente", "en_progreso", "completada"]
+        estado_filtro = estados_map[estado_seleccion - 1]
+        
+        tareas_filtradas = list(self.gestor.listar_tareas_por_estado(estado_filtro))
+        
+        if tareas_filtradas:
+            mostrar_subtitulo(f"Tareas {estado_filtro.replace('_', ' ')} ({len(tareas_filtradas)})")
+            mostrar_tabla_tareas(tareas_filtradas)
+        else:
+            mostrar_advertencia(f"No hay tareas en estado: {estado_filtro.replace('_', ' ')}")
+        
+        pausar()
     
     def filtrar_por_prioridad(self):
         """Filtra tareas por prioridad."""
-        try:
-            mostrar_titulo("FILTRAR POR PRIORIDAD")
-            
-            prioridades = ["🔴 Alta", "🟡 Media", "🟢 Baja"]
-            prioridad_seleccion = mostrar_menu_opciones(prioridades, "PRIORIDAD")
-            
-            prioridades_map = ["alta", "media", "baja"]
-            prioridad_filtro = prioridades_map[prioridad_seleccion - 1]
-            
-            tareas_filtradas = [t for t in self.gestor.tareas 
-                              if hasattr(t, 'prioridad') and t.prioridad == prioridad_filtro]
-            
-            if tareas_filtradas:
-                mostrar_subtitulo(f"Tareas de prioridad {prioridad_filtro} ({len(tareas_filtradas)})")
-                mostrar_tabla_tareas(tareas_filtradas)
-            else:
-                mostrar_advertencia(f"No hay tareas de prioridad: {prioridad_filtro}")
-            
-            pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+        mostrar_titulo("FILTRAR POR PRIORIDAD")
+        
+        prioridades = ["🔴 Alta", "🟡 Media", "🟢 Baja"]
+        prioridad_seleccion = mostrar_menu_opciones(prioridades, "PRIORIDAD")
+        
+        prioridades_map = ["alta", "media", "baja"]
+        prioridad_filtro = prioridades_map[prioridad_seleccion - 1]
+        
+        tareas_filtradas = list(self.gestor.listar_tareas_por_prioridad(prioridad_filtro))
+        
+        if tareas_filtradas:
+            mostrar_subtitulo(f"Tareas de prioridad {prioridad_filtro} ({len(tareas_filtradas)})")
+            mostrar_tabla_tareas(tareas_filtradas)
+        else:
+            mostrar_advertencia(f"No hay tareas de prioridad: {prioridad_filtro}")
+        
+        pausar()
     
     def tareas_por_usuario(self):
         """Muestra tareas de un usuario específico."""
-        try:
-            mostrar_titulo("TAREAS POR USUARIO")
-            
-            if not self.gestor.usuarios:
-                mostrar_error("No hay usuarios registrados")
-                pausar()
-                return
-            
-            print("Selecciona un usuario:")
-            mostrar_tabla_usuarios(self.gestor.usuarios)
+        mostrar_titulo("TAREAS POR USUARIO")
+        
+        if not self.gestor.usuarios:
+            mostrar_error("No hay usuarios registrados")
+            pausar()
+            return
+        
+        print("Selecciona un usuario:")
+        mostrar_tabla_usuarios(self.gestor.usuarios)
+        
+        while True:
+            try:
+                indice_usuario = int(solicitar_entrada_requerida("Número de usuario")) - 1
+                if 0 <= indice_usuario < len(self.gestor.usuarios):
+                    usuario_seleccionado = self.gestor.usuarios[indice_usuario]
+                    break
+                else:
+                    mostrar_error("Número de usuario inválido")
+            except ValueError:
+                mostrar_error("Por favor ingresa un número válido")
+        
+        # Obtener tareas del usuario
+        tareas_usuario = list(self.gestor.listar_tareas_por_usuario(usuario_seleccionado.id))
+        
+        if tareas_usuario:
+            mostrar_subtitulo(f"Tareas de {usuario_seleccionado.nombre} ({len(tareas_usuario)})")
+            mostrar_tabla_tareas(tareas_usuario)
             
-            while True:
-                try:
-                    indice_usuario = int(solicitar_entrada_requerida("Número de usuario")) - 1
-                    if 0 <= indice_usuario < len(self.gestor.usuarios):
-                        usuario_seleccionado = self.gestor.usuarios[indice_usuario]
-                        break
-                    else:
-                        mostrar_error("Número de usuario inválido")
-                except ValueError:
-                    mostrar_error("Por favor ingresa un número válido")
+            # Estadísticas del usuario (conteos en caché del gestor)
+            conteo = self.gestor.contar_tareas_por_estado(usuario_seleccionado.id)
+            pendientes = conteo['pendiente']
+            en_progreso = conteo['en_progreso']
+            completadas = conteo['completada']
             
-            # Obtener tareas del usuario
-            tareas_usuario = [t for t in self.gestor.tareas if t.usuario_id == usuario_seleccionado.id]
+            print(f"\n📊 ESTADÍSTICAS DEL USUARIO:")
+            print(f"  • Pendientes: {pendientes}")
+            print(f"  • En progreso: {en_progreso}")
+            print(f"  • Completadas: {completadas}")
             
             if tareas_usuario:
-                mostrar_subtitulo(f"Tareas de {usuario_seleccionado.nombre} ({len(tareas_usuario)})")
-                mostrar_tabla_tareas(tareas_usuario)
-                
-                # Estadísticas del usuario
-                pendientes = len([t for t in tareas_usuario if t.estado.value == 'pendiente'])
-                en_progreso = len([t for t in tareas_usuario if t.estado.value == 'en_progreso'])
-                completadas = len([t for t in tareas_usuario if t.estado.value == 'completada'])
-                
-                print(f"\n📊 ESTADÍSTICAS DEL USUARIO:")
-                print(f"  • Pendientes: {pendientes}")
-                print(f"  • En progreso: {en_progreso}")
-                print(f"  • Completadas: {completadas}")
-                
-                if tareas_usuario:
-                    porcentaje_completado = (completadas / len(tareas_usuario)) * 100
-                    print(f"  • Porcentaje de completado: {porcentaje_completado:.1f}%")
-                
-            else:
-                mostrar_advertencia(f"{usuario_seleccionado.nombre} no tiene tareas asignadas")
+                porcentaje_completado = (completadas / len(tareas_usuario)) * 100
+                print(f"  • Porcentaje de completado: {porcentaje_completado:.1f}%")
             
-            pausar()
-            
-        except Exception as e:
-            manejar_error_sistema(e)
+        else:
+            mostrar_advertencia(f"{usuario_seleccionado.nombre} no tiene tareas asignadas")
+        
+        pausar()
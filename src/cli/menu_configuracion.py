@@ -6,7 +6,9 @@ gestionar datos y realizar tareas administrativas.
 """
 
 import os
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timedelta
 
 # Importaciones usando try/except para manejar diferentes contextos
 try:
@@ -23,6 +25,20 @@ except ImportError:
     )
 
 
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "💾 Guardar datos del sistema",
+    "🔄 Cargar datos del sistema",
+    "🔒 Crear backup completo",
+    "🧹 Limpiar tareas vencidas",
+    "📊 Información del sistema",
+    "🔧 Configuración avanzada",
+    "📁 Gestión de archivos",
+    "🚨 Herramientas de diagnóstico",
+    "⬅️ Volver al menú principal",
+)
+
+
 class MenuConfiguracion:
     """
     Clase que maneja el menú de configuración del sistema.
@@ -43,20 +59,8 @@ class MenuConfiguracion:
         """
         while True:
             try:
-                opciones = [
-                    "💾 Guardar datos del sistema",
-                    "🔄 Cargar datos del sistema",
-                    "🔒 Crear backup completo",
-                    "🧹 Limpiar tareas vencidas",
-                    "📊 Información del sistema",
-                    "🔧 Configuración avanzada",
-                    "📁 Gestión de archivos",
-                    "🚨 Herramientas de diagnóstico",
-                    "⬅️ Volver al menú principal"
-                ]
-                
                 mostrar_titulo("CONFIGURACIÓN DEL SISTEMA")
-                seleccion = mostrar_menu_opciones(opciones)
+                seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
                 
                 if seleccion == 1:
                     self.guardar_datos()
@@ -86,10 +90,10 @@ class MenuConfiguracion:
             mostrar_titulo("GUARDAR DATOS DEL SISTEMA")
             
             # Seleccionar formato
-            formatos = ["📄 JSON (recomendado)", "🔒 Binario"]
+            formatos = ["📄 JSON (recomendado)", "🔒 Binario", "📦 Ambos formatos"]
             formato_seleccion = mostrar_menu_opciones(formatos, "FORMATO")
             
-            formato = "json" if formato_seleccion == 1 else "binario"
+            formato = ("json", "binario", "todos")[formato_seleccion - 1]
             
             print(f"\nGuardando datos en formato {formato}...")
             
@@ -204,13 +208,11 @@ class MenuConfiguracion:
             try:
                 data_dir = "data"
                 if os.path.exists(data_dir):
-                    archivos = os.listdir(data_dir)
                     print(f"\n📁 ARCHIVOS DE DATOS:")
-                    for archivo in archivos:
-                        ruta_completa = os.path.join(data_dir, archivo)
-                        if os.path.isfile(ruta_completa):
-                            tamaño = os.path.getsize(ruta_completa)
-                            print(f"  • {archivo}: {tamaño} bytes")
+                    with os.scandir(data_dir) as entradas:
+                        for entrada in entradas:
+                            if entrada.is_file():
+                                print(f"  • {entrada.name}: {entrada.stat().st_size} bytes")
                 else:
                     print(f"\n📁 Directorio de datos: No existe")
             except Exception:
@@ -256,8 +258,7 @@ class MenuConfiguracion:
         mostrar_advertencia("Esta acción eliminará todos los datos en memoria")
         
         if confirmar_accion("¿Estás seguro de reiniciar el sistema?"):
-            self.gestor.usuarios.clear()
-            self.gestor.tareas.clear()
+            self.gestor.reiniciar()
             mostrar_exito("Sistema reiniciado - memoria limpia")
         else:
             mostrar_advertencia("Reinicio cancelado")
@@ -268,14 +269,13 @@ class MenuConfiguracion:
         """Genera datos de prueba para el sistema."""
         if confirmar_accion("¿Generar datos de prueba? (esto añadirá usuarios y tareas de ejemplo)"):
             try:
-                from datetime import timedelta
-                
                 # Crear usuarios de prueba
                 usuario1 = self.gestor.crear_usuario("Usuario Prueba 1", "prueba1@test.com")
                 usuario2 = self.gestor.crear_usuario("Usuario Prueba 2", "prueba2@test.com")
                 
-                # Crear tareas de prueba
-                fecha_futura = datetime.now() + timedelta(days=7)
+                # Crear tareas de prueba (una sola lectura del reloj para ambas fechas)
+                ahora = datetime.now()
+                fecha_futura = ahora + timedelta(days=7)
                 if usuario1:
                     self.gestor.crear_tarea(
                         "Tarea de prueba 1", 
@@ -285,7 +285,7 @@ class MenuConfiguracion:
                     )
                 
                 if usuario2:
-                    fecha_futura2 = datetime.now() + timedelta(days=3)
+                    fecha_futura2 = ahora + timedelta(days=3)
                     self.gestor.crear_tarea(
                         "Tarea urgente de prueba", 
                         "Tarea con fecha límite próxima", 
@@ -323,8 +323,7 @@ class MenuConfiguracion:
         
         if errores:
             mostrar_error(f"Se encontraron {len(errores)} errores de integridad:")
-            for error in errores:
-                print(f"  • {error}")
+            print("\n".join(f"  • {error}" for error in errores))
         else:
             mostrar_exito("✅ Integridad de datos validada correctamente")
         
@@ -381,15 +380,15 @@ class MenuConfiguracion:
         try:
             data_dir = "data"
             if os.path.exists(data_dir):
-                archivos = os.listdir(data_dir)
-                if archivos:
+                with os.scandir(data_dir) as iterador:
+                    entradas = sorted(iterador, key=lambda entrada: entrada.name)
+                if entradas:
                     print(f"\n📁 ARCHIVOS EN {data_dir}:")
-                    for archivo in sorted(archivos):
-                        ruta_completa = os.path.join(data_dir, archivo)
-                        if os.path.isfile(ruta_completa):
-                            tamaño = os.path.getsize(ruta_completa)
-                            fecha_mod = datetime.fromtimestamp(os.path.getmtime(ruta_completa))
-                            print(f"  • {archivo:20} - {tamaño:8} bytes - {fecha_mod.strftime('%d/%m/%Y %H:%M')}")
+                    for entrada in entradas:
+                        if entrada.is_file():
+                            info = entrada.stat()
+                            fecha_mod = datetime.fromtimestamp(info.st_mtime)
+                            print(f"  • {entrada.name:20} - {info.st_size:8} bytes - {fecha_mod.strftime('%d/%m/%Y %H:%M')}")
                 else:
                     mostrar_advertencia("No hay archivos en el directorio de datos")
             else:
@@ -407,11 +406,11 @@ class MenuConfiguracion:
                 total_archivos = 0
                 tamaño_total = 0
                 
-                for archivo in os.listdir(data_dir):
-                    ruta_completa = os.path.join(data_dir, archivo)
-                    if os.path.isfile(ruta_completa):
-                        total_archivos += 1
-                        tamaño_total += os.path.getsize(ruta_completa)
+                with os.scandir(data_dir) as entradas:
+                    for entrada in entradas:
+                        if entrada.is_file():
+                            total_archivos += 1
+                            tamaño_total += entrada.stat().st_size
                 
                 print(f"\n📊 ESTADÍSTICAS DE ARCHIVOS:")
                 print(f"  • Total de archivos: {total_archivos}")
@@ -485,8 +484,6 @@ class MenuConfiguracion:
     
     def estado_memoria(self):
         """Muestra el estado actual de la memoria."""
-        import sys
-        
         print(f"\n🧠 ESTADO DE MEMORIA:")
         print(f"  • Usuarios cargados: {len(self.gestor.usuarios)}")
         print(f"  • Tareas cargadas: {len(self.gestor.tareas)}")
@@ -503,8 +500,6 @@ class MenuConfiguracion:
         """Ejecuta un test básico de rendimiento."""
         print("Ejecutando test de rendimiento...")
         
-        import time
-        
         # Test de búsqueda
         inicio = time.time()
         for _ in range(1000):
@@ -33,6 +33,30 @@ except ImportError:
     )
     from services.gestor_sistema import GestorSistema
 
+# Gestor de la sesión en curso, para reutilizarlo al interrumpir el programa
+_gestor_activo: Optional[GestorSistema] = None
+
+
+def obtener_gestor_activo() -> Optional[GestorSistema]:
+    """
+    Obtiene el gestor del sistema de la sesión CLI en curso.
+
+    Returns:
+        Optional[GestorSistema]: Gestor activo o None si no se ha inicializado
+    """
+    return _gestor_activo
+
+
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "👥 Gestión de Usuarios",
+    "📋 Gestión de Tareas",
+    "📊 Reportes y Estadísticas",
+    "🔍 Búsquedas y Filtros",
+    "⚙️ Configuración del Sistema",
+    "🚪 Salir",
+)
+
 
 class MenuPrincipal:
     """
@@ -41,8 +65,10 @@ class MenuPrincipal:
 
     def __init__(self):
         """Inicializa el menú principal con el gestor del sistema."""
+        global _gestor_activo
         try:
             self.gestor = GestorSistema()
+            _gestor_activo = self.gestor
         except Exception as e:
             manejar_error_sistema(e)
 
@@ -86,18 +112,8 @@ class MenuPrincipal:
         except Exception as e:
             print(f"Error al obtener estadísticas: {e}")
 
-        # Opciones del menú principal
-        opciones = [
-            "👥 Gestión de Usuarios",
-            "📋 Gestión de Tareas",
-            "📊 Reportes y Estadísticas",
-            "🔍 Búsquedas y Filtros",
-            "⚙️ Configuración del Sistema",
-            "🚪 Salir",
-        ]
-
         mostrar_titulo("MENÚ PRINCIPAL")
-        seleccion = mostrar_menu_opciones(opciones)
+        seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
 
         # Procesar selección
         if seleccion == 1:
@@ -20,6 +20,19 @@ except ImportError:
     )
 
 
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "📊 Dashboard ejecutivo",
+    "👥 Reporte de usuarios",
+    "📋 Reporte de tareas",
+    "📅 Reporte de calendario",
+    "📈 Reporte de productividad",
+    "🎯 Estadísticas generales",
+    "📑 Exportar reporte",
+    "⬅️ Volver al menú principal",
+)
+
+
 class MenuReportes:
     """
     Clase que maneja el menú de reportes y estadísticas.
@@ -40,19 +53,8 @@ class MenuReportes:
         """
         while True:
             try:
-                opciones = [
-                    "📊 Dashboard ejecutivo",
-                    "👥 Reporte de usuarios",
-                    "📋 Reporte de tareas",
-                    "📅 Reporte de calendario",
-                    "📈 Reporte de productividad",
-                    "🎯 Estadísticas generales",
-                    "📑 Exportar reporte",
-                    "⬅️ Volver al menú principal"
-                ]
-                
                 mostrar_titulo("REPORTES Y ESTADÍSTICAS")
-                seleccion = mostrar_menu_opciones(opciones)
+                seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
                 
                 if seleccion == 1:
                     self.mostrar_dashboard()
@@ -10,7 +10,7 @@ from datetime import datetime
 
 # Importaciones usando try/except para manejar diferentes contextos
 try:
-    from ..models.tarea import Tarea
+    from ..models.tarea import ESTADO_VALUES, ESTADOS_POR_VALOR, Tarea
     from ..models.usuario import Usuario
     from .cli_utils import (
         mostrar_titulo, mostrar_subtitulo, mostrar_menu_opciones,
@@ -20,7 +20,7 @@ try:
         manejar_error_sistema, formatear_fecha_legible
     )
 except ImportError:
-    from models.tarea import Tarea
+    from models.tarea import ESTADO_VALUES, ESTADOS_POR_VALOR, Tarea
     from models.usuario import Usuario
     from cli.cli_utils import (
         mostrar_titulo, mostrar_subtitulo, mostrar_menu_opciones,
@@ -31,6 +31,20 @@ except ImportError:
     )
 
 
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "📝 Crear nueva tarea",
+    "👀 Ver todas las tareas",
+    "🔍 Buscar tareas",
+    "✏️ Editar tarea",
+    "🔄 Cambiar estado de tarea",
+    "🗑️ Eliminar tarea",
+    "📋 Ver detalles de tarea",
+    "👤 Ver tareas por usuario",
+    "⬅️ Volver al menú principal",
+)
+
+
 class MenuTareas:
     """
     Clase que maneja el menú de gestión de tareas.
@@ -51,20 +65,8 @@ class MenuTareas:
         """
         while True:
             try:
-                opciones = [
-                    "📝 Crear nueva tarea",
-                    "👀 Ver todas las tareas",
-                    "🔍 Buscar tareas",
-                    "✏️ Editar tarea",
-                    "🔄 Cambiar estado de tarea",
-                    "🗑️ Eliminar tarea",
-                    "📋 Ver detalles de tarea",
-                    "👤 Ver tareas por usuario",
-                    "⬅️ Volver al menú principal"
-                ]
-                
                 mostrar_titulo("GESTIÓN DE TAREAS")
-                seleccion = mostrar_menu_opciones(opciones)
+                seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
                 
                 if seleccion == 1:
                     self.crear_tarea()
@@ -286,22 +288,10 @@ class MenuTareas:
             estados_opciones = ["📋 Pendiente", "⏳ En progreso", "✅ Completada"]
             nueva_seleccion = mostrar_menu_opciones(estados_opciones, "NUEVO ESTADO")
             
-            estados = ["pendiente", "en_progreso", "completada"]
-            nuevo_estado = estados[nueva_seleccion - 1]
+            nuevo_estado = ESTADO_VALUES[nueva_seleccion - 1]
             
             # Mapear estado string a Enum
-            try:
-                from ..models.tarea import EstadoTarea
-            except ImportError:
-                from models.tarea import EstadoTarea
-            
-            estados_map = {
-                "pendiente": EstadoTarea.PENDIENTE,
-                "en_progreso": EstadoTarea.EN_PROGRESO,
-                "completada": EstadoTarea.COMPLETADA
-            }
-            
-            nuevo_estado_enum = estados_map[nuevo_estado]
+            nuevo_estado_enum = ESTADOS_POR_VALOR[nuevo_estado]
             
             if nuevo_estado_enum != tarea.estado:
                 tarea.estado = nuevo_estado_enum
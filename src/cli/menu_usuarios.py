@@ -26,6 +26,18 @@ except ImportError:
     )
 
 
+# Opciones del menú, construidas una sola vez al importar el módulo
+_OPCIONES_MENU = (
+    "📝 Crear nuevo usuario",
+    "👀 Ver todos los usuarios",
+    "🔍 Buscar usuario",
+    "✏️ Editar usuario",
+    "🗑️ Eliminar usuario",
+    "👤 Ver detalles de usuario",
+    "⬅️ Volver al menú principal",
+)
+
+
 class MenuUsuarios:
     """
     Clase que maneja el menú de gestión de usuarios.
@@ -46,18 +58,8 @@ class MenuUsuarios:
         """
         while True:
             try:
-                opciones = [
-                    "📝 Crear nuevo usuario",
-                    "👀 Ver todos los usuarios", 
-                    "🔍 Buscar usuario",
-                    "✏️ Editar usuario",
-                    "🗑️ Eliminar usuario",
-                    "👤 Ver detalles de usuario",
-                    "⬅️ Volver al menú principal"
-                ]
-                
                 mostrar_titulo("GESTIÓN DE USUARIOS")
-                seleccion = mostrar_menu_opciones(opciones)
+                seleccion = mostrar_menu_opciones(_OPCIONES_MENU)
                 
                 if seleccion == 1:
                     self.crear_usuario()
@@ -194,8 +196,10 @@ class MenuUsuarios:
             usuario.email = nuevo_email
             usuario.telefono = nuevo_telefono if nuevo_telefono else None
             
-            # El gestor no tiene método actualizar_usuario, los cambios son directos
-            mostrar_exito("Usuario actualizado exitosamente")
+            if self.gestor.actualizar_usuario(usuario):
+                mostrar_exito("Usuario actualizado exitosamente")
+            else:
+                mostrar_error("No se pudo actualizar el usuario")
             
             pausar()
             
@@ -248,19 +252,15 @@ class MenuUsuarios:
             print(f"Teléfono: {usuario.telefono or 'No especificado'}")
             print(f"Fecha de registro: {usuario.fecha_registro.strftime('%d/%m/%Y %H:%M')}")
             
-            # Obtener tareas del usuario
+            # Obtener tareas del usuario (conteos en caché del gestor)
             try:
-                tareas_usuario = [t for t in self.gestor.tareas if t.usuario_id == usuario.id]
-                print(f"\n📋 TAREAS ASIGNADAS: {len(tareas_usuario)}")
+                conteos = self.gestor.contar_tareas_por_estado(usuario.id)
+                print(f"\n📋 TAREAS ASIGNADAS: {sum(conteos.values())}")
                 
-                if tareas_usuario:
-                    pendientes = len([t for t in tareas_usuario if t.estado.value == 'pendiente'])
-                    en_progreso = len([t for t in tareas_usuario if t.estado.value == 'en_progreso'])
-                    completadas = len([t for t in tareas_usuario if t.estado.value == 'completada'])
-                    
-                    print(f"  • Pendientes: {pendientes}")
-                    print(f"  • En progreso: {en_progreso}")
-                    print(f"  • Completadas: {completadas}")
+                if conteos:
+                    print(f"  • Pendientes: {conteos['pendiente']}")
+                    print(f"  • En progreso: {conteos['en_progreso']}")
+                    print(f"  • Completadas: {conteos['completada']}")
                 
             except Exception:
                 print("No se pudieron obtener las tareas del usuario")
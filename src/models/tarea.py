@@ -6,7 +6,7 @@ y métodos para gestionar el estado y asignación.
 """
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, Optional
 
@@ -21,6 +21,11 @@ class EstadoTarea(Enum):
     COMPLETADA = "completada"
 
 
+# Valores de estado precalculados para evitar recorrer la enumeración
+ESTADO_VALUES = tuple(estado.value for estado in EstadoTarea)
+ESTADOS_POR_VALOR = {estado.value: estado for estado in EstadoTarea}
+
+
 class Tarea:
     """
     Clase que representa una tarea en el sistema de gestión de tareas.
@@ -63,11 +68,14 @@ class Tarea:
         if not titulo or not titulo.strip():
             raise ValueError("El título no puede estar vacío")
 
+        # Una sola lectura del reloj para validar y registrar la creación
+        ahora = datetime.now()
+
         # Validar fecha límite si se proporciona
         # Solo validar fechas futuras para NUEVAS tareas, no para datos cargados
         if (
             fecha_limite
-            and fecha_limite <= datetime.now()
+            and fecha_limite <= ahora
             and not hasattr(self, "_cargando_desde_archivo")
         ):
             raise ValueError("La fecha límite debe ser futura")
@@ -75,13 +83,67 @@ class Tarea:
         self.id = str(uuid.uuid4())
         self.titulo = titulo.strip().title()  # Formateo de cadenas
         self.descripcion = descripcion.strip() if descripcion else None
-        self.fecha_creacion = datetime.now()
+        self.fecha_creacion = ahora
         self.fecha_limite = fecha_limite
         self.fecha_finalizacion: Optional[datetime] = None
         self.estado = EstadoTarea.PENDIENTE
         self.usuario_id = usuario_id
         self.prioridad = prioridad
 
+    @property
+    def titulo(self) -> str:
+        """Título de la tarea."""
+        return self._titulo
+
+    @titulo.setter
+    def titulo(self, valor: str) -> None:
+        """Asigna el título y actualiza sus versiones en minúsculas y recortada."""
+        self._titulo = valor
+        self._titulo_lower = valor.lower()
+        self._titulo_corto = valor[:30]
+
+    @property
+    def titulo_lower(self) -> str:
+        """Título en minúsculas, precalculado para búsquedas."""
+        return self._titulo_lower
+
+    @property
+    def titulo_corto(self) -> str:
+        """Primeros 30 caracteres del título, precalculados para listados."""
+        return self._titulo_corto
+
+    @property
+    def fecha_creacion(self) -> datetime:
+        """Fecha y hora de creación de la tarea."""
+        return self._fecha_creacion
+
+    @fecha_creacion.setter
+    def fecha_creacion(self, valor: datetime) -> None:
+        """Asigna la fecha de creación y guarda su día para filtros por fecha."""
+        self._fecha_creacion = valor
+        self._fecha_creacion_dia = valor.date()
+
+    @property
+    def fecha_creacion_dia(self) -> date:
+        """Día de creación (sin hora), precalculado al asignar fecha_creacion."""
+        return self._fecha_creacion_dia
+
+    @property
+    def descripcion(self) -> Optional[str]:
+        """Descripción de la tarea."""
+        return self._descripcion
+
+    @descripcion.setter
+    def descripcion(self, valor: Optional[str]) -> None:
+        """Asigna la descripción y actualiza su versión en minúsculas para búsquedas."""
+        self._descripcion = valor
+        self._descripcion_lower = valor.lower() if valor else ""
+
+    @property
+    def descripcion_lower(self) -> str:
+        """Descripción en minúsculas (vacía si no hay), precalculada para búsquedas."""
+        return self._descripcion_lower
+
     def cambiar_estado(self, nuevo_estado: EstadoTarea) -> bool:
         """
         Cambia el estado de la tarea.
@@ -131,10 +193,15 @@ class Tarea:
 
         return True
 
-    def calcular_dias_restantes(self) -> int:
+    def calcular_dias_restantes(self, ahora: Optional[datetime] = None) -> int:
         """
         Calcula los días restantes hasta la fecha límite.
 
+        Args:
+            ahora (Optional[datetime]): Momento de referencia; por defecto la
+                hora actual. Permite reutilizar una sola lectura del reloj al
+                recorrer muchas tareas.
+
         Returns:
             int: Número de días restantes (negativo si está vencida)
         """
@@ -143,13 +210,19 @@ class Tarea:
         if isinstance(fecha_limite, str):
             fecha_limite = datetime.fromisoformat(fecha_limite)
         
-        diferencia = fecha_limite - datetime.now()
+        if ahora is None:
+            ahora = datetime.now()
+        diferencia = fecha_limite - ahora
         return diferencia.days
 
-    def esta_vencida(self) -> bool:
+    def esta_vencida(self, ahora: Optional[datetime] = None) -> bool:
         """
         Verifica si la tarea está vencida.
 
+        Args:
+            ahora (Optional[datetime]): Momento de referencia; por defecto la
+                hora actual
+
         Returns:
             bool: True si la fecha límite ya pasó
         """
@@ -158,7 +231,9 @@ class Tarea:
         if isinstance(fecha_limite, str):
             fecha_limite = datetime.fromisoformat(fecha_limite)
         
-        return datetime.now() > fecha_limite
+        if ahora is None:
+            ahora = datetime.now()
+        return ahora > fecha_limite
 
     def obtener_duracion_estimada(self) -> int:
         """
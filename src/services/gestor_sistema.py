@@ -6,8 +6,10 @@ usuarios, tareas, persistencia, reportes y utilidades.
 """
 
 import os
+from bisect import bisect_left
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple
 from uuid import uuid4
 
 # Importar sistema de logging
@@ -30,39 +32,45 @@ except ImportError:
 
 # Importaciones de modelos
 try:
-    from ..models.tarea import EstadoTarea, Tarea
+    from ..models.tarea import ESTADO_VALUES, ESTADOS_POR_VALOR, EstadoTarea, Tarea
     from ..models.usuario import Usuario
     from ..utils.formateo import (
         formatear_fecha_legible,
         limpiar_descripcion,
+        normalizar_para_busqueda,
         validar_email,
     )
     from ..utils.generadores import (
         GeneradorInfinito,
-        generador_tareas_por_estado,
-        generador_tareas_proximas_vencer,
         generador_usuarios_con_tareas,
     )
     from .persistencia import GestorPersistencia
     from .reportes import GeneradorReportes
 except ImportError:
-    from models.tarea import EstadoTarea, Tarea
+    from models.tarea import ESTADO_VALUES, ESTADOS_POR_VALOR, EstadoTarea, Tarea
     from models.usuario import Usuario
     from services.persistencia import GestorPersistencia
     from services.reportes import GeneradorReportes
     from utils.formateo import (
         formatear_fecha_legible,
         limpiar_descripcion,
+        normalizar_para_busqueda,
         validar_email,
     )
     from utils.generadores import (
         GeneradorInfinito,
-        generador_tareas_por_estado,
-        generador_tareas_proximas_vencer,
         generador_usuarios_con_tareas,
     )
 
 
+# Número máximo de búsquedas recordadas entre modificaciones de datos
+MAX_BUSQUEDAS_EN_CACHE = 64
+
+# Valor por defecto de contar_tareas_por_estado: contar todas las tareas.
+# Permite que usuario_id=None se refiera a las tareas sin asignar.
+_TODAS_LAS_TAREAS = object()
+
+
 class GestorSistema:
     """
     Clase principal que coordina todas las funcionalidades del sistema de tareas.
@@ -95,6 +103,16 @@ class GestorSistema:
         # Configurar generador de IDs únicos
         self._generador_ids = GeneradorInfinito("TASK")
 
+        # Índices en memoria, reconstruidos bajo demanda tras cada modificación
+        self._version = 0
+        self._indice_estado: Optional[Dict[str, List[Tarea]]] = None
+        self._indice_prioridad: Optional[Dict[str, List[Tarea]]] = None
+        self._indice_usuario: Optional[Dict[Optional[str], List[Tarea]]] = None
+        self._indice_fecha: Optional[Tuple[List[datetime], List[Tarea]]] = None
+        self._conteos_por_usuario: Optional[Dict[Optional[str], Counter]] = None
+        self._indice_busqueda_usuarios: Optional[List[Tuple[str, str, Usuario]]] = None
+        self._cache_busquedas: Dict[Tuple[str, str], list] = {}
+
         # Cargar datos existentes si los hay
         self._cargar_datos_sistema()
 
@@ -138,34 +156,183 @@ class GestorSistema:
             )
             # Continuar con listas vacías
 
+        self._invalidar_indices()
+
+    def _invalidar_indices(self) -> None:
+        """Marca los índices en memoria como obsoletos tras una modificación."""
+        self._version += 1
+        self._indice_estado = None
+        self._indice_prioridad = None
+        self._indice_usuario = None
+        self._indice_fecha = None
+        self._conteos_por_usuario = None
+        self._indice_busqueda_usuarios = None
+        self._cache_busquedas.clear()
+
+    def _obtener_indice_estado(self) -> Dict[str, List[Tarea]]:
+        """
+        Obtiene el índice de tareas agrupadas por estado.
+
+        El índice se construye en una sola pasada y se reutiliza hasta que
+        alguna operación modifique las tareas.
+
+        Returns:
+            Dict[str, List[Tarea]]: Tareas agrupadas por valor de estado
+        """
+        if self._indice_estado is None:
+            indice = {valor: [] for valor in ESTADO_VALUES}
+            for tarea in self.tareas:
+                indice[tarea.estado.value].append(tarea)
+            self._indice_estado = indice
+        return self._indice_estado
+
+    def _obtener_indice_prioridad(self) -> Dict[str, List[Tarea]]:
+        """
+        Obtiene el índice de tareas agrupadas por prioridad.
+
+        Returns:
+            Dict[str, List[Tarea]]: Tareas agrupadas por prioridad
+        """
+        if self._indice_prioridad is None:
+            indice: Dict[str, List[Tarea]] = {}
+            for tarea in self.tareas:
+                indice.setdefault(tarea.prioridad, []).append(tarea)
+            self._indice_prioridad = indice
+        return self._indice_prioridad
+
+    def _obtener_indice_usuario(self) -> Dict[Optional[str], List[Tarea]]:
+        """
+        Obtiene el índice de tareas agrupadas por usuario asignado.
+
+        Las tareas sin asignar quedan bajo la clave None.
+
+        Returns:
+            Dict[Optional[str], List[Tarea]]: Tareas agrupadas por ID de usuario
+        """
+        if self._indice_usuario is None:
+            indice: Dict[Optional[str], List[Tarea]] = {}
+            for tarea in self.tareas:
+                indice.setdefault(tarea.usuario_id, []).append(tarea)
+            self._indice_usuario = indice
+        return self._indice_usuario
+
+    def _obtener_indice_fecha(self) -> Tuple[List[datetime], List[Tarea]]:
+        """
+        Obtiene el índice de tareas ordenadas por fecha límite.
+
+        Solo incluye las tareas que tienen fecha límite. Las dos listas son
+        paralelas, de modo que un rango de fechas se localiza con bisect.
+
+        Returns:
+            Tuple[List[datetime], List[Tarea]]: (fechas ordenadas, tareas en el mismo orden)
+        """
+        if self._indice_fecha is None:
+            pares = []
+            for tarea in self.tareas:
+                fecha_limite = tarea.fecha_limite
+                if not fecha_limite:
+                    continue
+                if isinstance(fecha_limite, str):
+                    fecha_limite = datetime.fromisoformat(fecha_limite)
+                pares.append((fecha_limite, tarea))
+            pares.sort(key=lambda par: par[0])
+            self._indice_fecha = (
+                [fecha for fecha, _ in pares],
+                [tarea for _, tarea in pares],
+            )
+        return self._indice_fecha
+
+    def _obtener_indice_busqueda_usuarios(self) -> List[Tuple[str, str, Usuario]]:
+        """
+        Obtiene el índice de búsqueda de usuarios.
+
+        Cada entrada guarda el nombre y el email normalizados (sin mayúsculas
+        ni acentos) junto al usuario, y se reutiliza hasta que alguna
+        operación modifique datos.
+
+        Returns:
+            List[Tuple[str, str, Usuario]]: (nombre_normalizado, email_normalizado, usuario)
+        """
+        if self._indice_busqueda_usuarios is None:
+            self._indice_busqueda_usuarios = [
+                (
+                    normalizar_para_busqueda(usuario.nombre),
+                    normalizar_para_busqueda(usuario.email),
+                    usuario,
+                )
+                for usuario in self.usuarios
+            ]
+        return self._indice_busqueda_usuarios
+
+    def _buscar_con_cache(
+        self, tipo: str, termino_lower: str, buscar: Callable[[str], list]
+    ) -> list:
+        """
+        Resuelve una búsqueda reutilizando el resultado si ya se hizo.
+
+        La caché se vacía en cada modificación de datos y, al llenarse,
+        descarta la búsqueda más antigua.
+
+        Args:
+            tipo (str): Tipo de búsqueda ('tareas' o 'usuarios')
+            termino_lower (str): Término ya normalizado para la búsqueda
+            buscar (Callable[[str], list]): Función que realiza la búsqueda
+
+        Returns:
+            list: Copia de la lista de resultados
+        """
+        clave = (tipo, termino_lower)
+        resultados = self._cache_busquedas.get(clave)
+        if resultados is None:
+            resultados = buscar(termino_lower)
+            if len(self._cache_busquedas) >= MAX_BUSQUEDAS_EN_CACHE:
+                del self._cache_busquedas[next(iter(self._cache_busquedas))]
+            self._cache_busquedas[clave] = resultados
+        return list(resultados)
+
+    def _construir_payload(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Convierte usuarios y tareas a diccionarios para persistencia.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: Usuarios y tareas serializados
+        """
+        usuarios_data = [usuario.to_dict() for usuario in self.usuarios]
+        tareas_data = [tarea.to_dict() for tarea in self.tareas]
+        return usuarios_data, tareas_data
+
     def guardar_datos_sistema(self, formato: str = "json") -> bool:
         """
         Guarda todos los datos del sistema.
 
+        Con formato 'todos' los datos se convierten una sola vez y se
+        escriben tanto en JSON como en binario.
+
         Args:
-            formato (str): Formato de guardado ('json' o 'binario')
+            formato (str): Formato de guardado ('json', 'binario' o 'todos')
 
         Returns:
             bool: True si se guardó exitosamente
         """
+        if formato not in ("json", "binario", "todos"):
+            print(f"❌ Formato no válido: {formato}")
+            return False
+
         try:
             # Convertir a diccionarios para persistencia
-            usuarios_data = [usuario.to_dict() for usuario in self.usuarios]
-            tareas_data = [tarea.to_dict() for tarea in self.tareas]
-
-            if formato == "json":
-                resultado_usuarios = self.persistencia.guardar_usuarios(usuarios_data)
-                resultado_tareas = self.persistencia.guardar_tareas(tareas_data)
-            elif formato == "binario":
-                resultado_usuarios = self.persistencia.guardar_usuarios_binario(
-                    usuarios_data
+            usuarios_data, tareas_data = self._construir_payload()
+
+            resultados = []
+            if formato in ("json", "todos"):
+                resultados.append(self.persistencia.guardar_usuarios(usuarios_data))
+                resultados.append(self.persistencia.guardar_tareas(tareas_data))
+            if formato in ("binario", "todos"):
+                resultados.append(
+                    self.persistencia.guardar_usuarios_binario(usuarios_data)
                 )
-                resultado_tareas = self.persistencia.guardar_tareas_binario(tareas_data)
-            else:
-                print(f"❌ Formato no válido: {formato}")
-                return False
+                resultados.append(self.persistencia.guardar_tareas_binario(tareas_data))
 
-            if resultado_usuarios and resultado_tareas:
+            if all(resultados):
                 print(f"✅ Datos guardados exitosamente en formato {formato}")
                 return True
             else:
@@ -207,6 +374,55 @@ class GestorSistema:
             nombre (str): Nombre del usuario
             email (str): Email del usuario
 
+        Returns:
+            Optional[Usuario]: Usuario creado o None si hay error
+        """
+        usuario = self._registrar_usuario(nombre, email)
+        if usuario:
+            self._invalidar_indices()
+        return usuario
+
+    def crear_usuarios_bulk(self, datos_usuarios: List[Tuple[str, str]]) -> List[Usuario]:
+        """
+        Crea varios usuarios en una sola operación.
+
+        Aplica las mismas validaciones que crear_usuario, pero comprueba los
+        emails duplicados contra un único conjunto e invalida los índices
+        una sola vez al terminar.
+
+        Args:
+            datos_usuarios (List[Tuple[str, str]]): Tuplas (nombre, email)
+
+        Returns:
+            List[Usuario]: Usuarios creados (se omiten los que fallan la validación)
+        """
+        emails_existentes = {usuario.email.lower() for usuario in self.usuarios}
+        usuarios_creados = []
+
+        for nombre, email in datos_usuarios:
+            usuario = self._registrar_usuario(nombre, email, emails_existentes)
+            if usuario:
+                emails_existentes.add(usuario.email)
+                usuarios_creados.append(usuario)
+
+        if usuarios_creados:
+            self._invalidar_indices()
+        return usuarios_creados
+
+    def _registrar_usuario(
+        self,
+        nombre: str,
+        email: str,
+        emails_existentes: Optional[Set[str]] = None,
+    ) -> Optional[Usuario]:
+        """
+        Valida y agrega un usuario sin invalidar los índices en memoria.
+
+        Args:
+            nombre (str): Nombre del usuario
+            email (str): Email del usuario
+            emails_existentes (Set[str], optional): Emails ya registrados en minúsculas
+
         Returns:
             Optional[Usuario]: Usuario creado o None si hay error
         """
@@ -222,7 +438,11 @@ class GestorSistema:
             return None
 
         # Verificar email único
-        if any(u.email.lower() == email.lower() for u in self.usuarios):
+        if emails_existentes is not None:
+            duplicado = email.lower().strip() in emails_existentes
+        else:
+            duplicado = any(u.email.lower() == email.lower() for u in self.usuarios)
+        if duplicado:
             log_advertencia("Email duplicado", f"Ya existe usuario con email: {email}")
             return None
 
@@ -278,13 +498,30 @@ class GestorSistema:
 
     def listar_usuarios_activos(self) -> Generator[Dict[str, Any], None, None]:
         """
-        Genera usuarios que tienen tareas asignadas con sus detalles.
+        Genera todos los usuarios del sistema con el detalle de sus tareas.
 
         Yields:
-            Dict[str, Any]: Información del usuario con sus tareas
+            Dict[str, Any]: Información del usuario con sus tareas (vacías si no tiene)
         """
         return generador_usuarios_con_tareas(self.usuarios, self.tareas)
 
+    def actualizar_usuario(self, usuario: Usuario) -> bool:
+        """
+        Actualiza un usuario existente en el sistema.
+
+        Args:
+            usuario (Usuario): Usuario con los datos actualizados
+
+        Returns:
+            bool: True si se actualizó exitosamente
+        """
+        # El usuario ya está actualizado en memoria por referencia
+        # Solo necesitamos confirmar que existe
+        if self.obtener_usuario_por_id(usuario.id):
+            self._invalidar_indices()
+            return True
+        return False
+
     def eliminar_usuario(self, usuario_id: str) -> bool:
         """
         Elimina un usuario del sistema.
@@ -309,6 +546,7 @@ class GestorSistema:
 
         # Eliminar usuario
         self.usuarios.remove(usuario)
+        self._invalidar_indices()
         print(f"✅ Usuario eliminado: {usuario.nombre}")
         return True
 
@@ -332,6 +570,65 @@ class GestorSistema:
             fecha_limite (datetime): Fecha límite
             usuario_email (str, optional): Email del usuario asignado
 
+        Returns:
+            Optional[Tarea]: Tarea creada o None si hay error
+        """
+        tarea = self._registrar_tarea(titulo, descripcion, fecha_limite, usuario_email)
+        if tarea:
+            self._invalidar_indices()
+        return tarea
+
+    def crear_tareas_bulk(
+        self, datos_tareas: List[Tuple[Any, ...]]
+    ) -> List[Tarea]:
+        """
+        Crea varias tareas en una sola operación.
+
+        Aplica las mismas validaciones que crear_tarea, pero resuelve los
+        usuarios con un único diccionario por email e invalida los índices
+        una sola vez al terminar.
+
+        Args:
+            datos_tareas (List[Tuple[Any, ...]]): Tuplas
+                (titulo, descripcion, fecha_limite[, usuario_email])
+
+        Returns:
+            List[Tarea]: Tareas creadas (se omiten las que fallan la validación)
+        """
+        usuarios_por_email = {usuario.email: usuario for usuario in self.usuarios}
+        tareas_creadas = []
+
+        for titulo, descripcion, fecha_limite, *resto in datos_tareas:
+            usuario_email = resto[0] if resto else None
+            tarea = self._registrar_tarea(
+                titulo, descripcion, fecha_limite, usuario_email, usuarios_por_email
+            )
+            if tarea:
+                tareas_creadas.append(tarea)
+
+        if tareas_creadas:
+            self._invalidar_indices()
+        return tareas_creadas
+
+    def _registrar_tarea(
+        self,
+        titulo: str,
+        descripcion: str,
+        fecha_limite: datetime,
+        usuario_email: str = None,
+        usuarios_por_email: Optional[Dict[str, Usuario]] = None,
+    ) -> Optional[Tarea]:
+        """
+        Valida y agrega una tarea sin invalidar los índices en memoria.
+
+        Args:
+            titulo (str): Título de la tarea
+            descripcion (str): Descripción de la tarea
+            fecha_limite (datetime): Fecha límite
+            usuario_email (str, optional): Email del usuario asignado
+            usuarios_por_email (Dict[str, Usuario], optional): Usuarios
+                precargados por email para evitar búsquedas lineales
+
         Returns:
             Optional[Tarea]: Tarea creada o None si hay error
         """
@@ -349,9 +646,13 @@ class GestorSistema:
         descripcion_limpia = limpiar_descripcion(descripcion) if descripcion else None
 
         # Buscar usuario si se especifica
+        usuario = None
         usuario_id = None
         if usuario_email:
-            usuario = self.obtener_usuario_por_email(usuario_email)
+            if usuarios_por_email is not None:
+                usuario = usuarios_por_email.get(usuario_email.lower().strip())
+            else:
+                usuario = self.obtener_usuario_por_email(usuario_email)
             if not usuario:
                 print(f"❌ Usuario no encontrado: {usuario_email}")
                 return None
@@ -370,10 +671,8 @@ class GestorSistema:
             self.tareas.append(tarea)
 
             # Actualizar lista de tareas del usuario si está asignado
-            if usuario_id:
-                usuario = self.obtener_usuario_por_id(usuario_id)
-                if usuario and tarea.id not in usuario.tareas_asignadas:
-                    usuario.tareas_asignadas.append(tarea.id)
+            if usuario and tarea.id not in usuario.tareas_asignadas:
+                usuario.tareas_asignadas.append(tarea.id)
 
             print(f"✅ Tarea creada: {titulo}")
             return tarea
@@ -428,6 +727,7 @@ class GestorSistema:
         tarea.usuario_id = usuario.id
         if tarea_id not in usuario.tareas_asignadas:
             usuario.tareas_asignadas.append(tarea_id)
+        self._invalidar_indices()
 
         print(f"✅ Tarea '{tarea.titulo}' asignada a {usuario.nombre}")
         return True
@@ -449,18 +749,14 @@ class GestorSistema:
             return False
 
         try:
-            if nuevo_estado == "pendiente":
-                estado = EstadoTarea.PENDIENTE
-            elif nuevo_estado == "en_progreso":
-                estado = EstadoTarea.EN_PROGRESO
-            elif nuevo_estado == "completada":
-                estado = EstadoTarea.COMPLETADA
-            else:
+            estado = ESTADOS_POR_VALOR.get(nuevo_estado)
+            if estado is None:
                 print(f"❌ Estado no válido: {nuevo_estado}")
                 return False
 
             estado_anterior = tarea.estado.value
             tarea.estado = estado
+            self._invalidar_indices()
             print(
                 f"✅ Estado de tarea '{tarea.titulo}' cambiado: {estado_anterior} → {nuevo_estado}"
             )
@@ -470,6 +766,17 @@ class GestorSistema:
             print(f"❌ Error al cambiar estado: {e}")
             return False
 
+    def listar_todas_tareas(self) -> Generator[Tarea, None, None]:
+        """
+        Lista todas las tareas del sistema sin filtrar ni copiar.
+
+        Evita usar buscar_tareas con un término vacío para enumerar tareas.
+
+        Yields:
+            Tarea: Cada una de las tareas registradas
+        """
+        yield from self.tareas
+
     def listar_tareas_por_estado(self, estado: str) -> Generator[Tarea, None, None]:
         """
         Lista tareas filtradas por estado usando generadores.
@@ -480,7 +787,68 @@ class GestorSistema:
         Yields:
             Tarea: Tareas del estado especificado
         """
-        return generador_tareas_por_estado(self.tareas, estado)
+        yield from self._obtener_indice_estado().get(estado, [])
+
+    def listar_tareas_por_prioridad(self, prioridad: str) -> Generator[Tarea, None, None]:
+        """
+        Lista tareas filtradas por prioridad usando generadores.
+
+        Args:
+            prioridad (str): Prioridad a filtrar (alta, media, baja)
+
+        Yields:
+            Tarea: Tareas de la prioridad especificada
+        """
+        yield from self._obtener_indice_prioridad().get(prioridad, [])
+
+    def listar_tareas_por_usuario(self, usuario_id: str) -> Generator[Tarea, None, None]:
+        """
+        Lista las tareas asignadas a un usuario usando generadores.
+
+        Args:
+            usuario_id (str): ID del usuario
+
+        Yields:
+            Tarea: Tareas asignadas al usuario
+        """
+        yield from self._obtener_indice_usuario().get(usuario_id, [])
+
+    def contar_tareas(self) -> int:
+        """
+        Cuenta el total de tareas del sistema sin recorrerlas.
+
+        Returns:
+            int: Número total de tareas
+        """
+        return len(self.tareas)
+
+    def contar_tareas_por_estado(self, usuario_id: Optional[str] = _TODAS_LAS_TAREAS) -> Counter:
+        """
+        Cuenta las tareas por estado, en total o de un usuario.
+
+        Los conteos de todos los usuarios se calculan en una sola pasada y se
+        reutilizan hasta que alguna operación modifique los datos.
+
+        Args:
+            usuario_id (Optional[str]): ID del usuario, o None para las tareas
+                sin asignar. Si se omite se cuentan todas las tareas.
+
+        Returns:
+            Counter: Número de tareas por valor de estado
+        """
+        if usuario_id is _TODAS_LAS_TAREAS:
+            return Counter(
+                {valor: len(tareas) for valor, tareas in self._obtener_indice_estado().items()}
+            )
+
+        if self._conteos_por_usuario is None:
+            conteos: Dict[Optional[str], Counter] = {}
+            for tarea in self.tareas:
+                conteos.setdefault(tarea.usuario_id, Counter())[tarea.estado.value] += 1
+            self._conteos_por_usuario = conteos
+
+        # Copia para que el llamador no altere la caché
+        return Counter(self._conteos_por_usuario.get(usuario_id, Counter()))
 
     def obtener_tareas_proximas_vencer(
         self, dias: int = 7
@@ -492,9 +860,34 @@ class GestorSistema:
             dias (int): Número de días de anticipación
 
         Yields:
-            Tarea: Tareas próximas a vencer
+            Tarea: Tareas próximas a vencer, ordenadas por fecha límite
+        """
+        # 0 <= días restantes <= dias equivale a ahora <= fecha < ahora + dias + 1
+        ahora = datetime.now()
+        fechas, tareas = self._obtener_indice_fecha()
+        inicio = bisect_left(fechas, ahora)
+        fin = bisect_left(fechas, ahora + timedelta(days=dias + 1))
+        yield from tareas[inicio:fin]
+
+    def obtener_tareas_vencidas(
+        self, ahora: Optional[datetime] = None
+    ) -> Generator[Tarea, None, None]:
+        """
+        Obtiene las tareas no completadas cuya fecha límite ya pasó.
+
+        Args:
+            ahora (Optional[datetime]): Momento de referencia; por defecto la
+                hora actual
+
+        Yields:
+            Tarea: Tareas vencidas, ordenadas por fecha límite
         """
-        return generador_tareas_proximas_vencer(self.tareas, dias)
+        if ahora is None:
+            ahora = datetime.now()
+        fechas, tareas = self._obtener_indice_fecha()
+        for tarea in tareas[: bisect_left(fechas, ahora)]:
+            if tarea.estado != EstadoTarea.COMPLETADA:
+                yield tarea
 
     def actualizar_tarea(self, tarea: Tarea) -> bool:
         """
@@ -510,6 +903,7 @@ class GestorSistema:
         # Solo necesitamos confirmar que existe
         tarea_existente = self.obtener_tarea_por_id(tarea.id)
         if tarea_existente:
+            self._invalidar_indices()
             return True
         return False
     
@@ -536,6 +930,7 @@ class GestorSistema:
 
         # Eliminar tarea
         self.tareas.remove(tarea)
+        self._invalidar_indices()
         print(f"✅ Tarea eliminada: {tarea.titulo}")
         return True
 
@@ -623,32 +1018,38 @@ class GestorSistema:
         Returns:
             Dict[str, Any]: Diccionario con estadísticas
         """
-        # Usar generadores para calcular estadísticas
-        tareas_pendientes = list(self.listar_tareas_por_estado("pendiente"))
-        tareas_en_progreso = list(self.listar_tareas_por_estado("en_progreso"))
-        tareas_completadas = list(self.listar_tareas_por_estado("completada"))
-        usuarios_activos = list(self.listar_usuarios_activos())
-        tareas_proximas = list(self.obtener_tareas_proximas_vencer(3))
+        # Conteos por estado desde el índice en memoria
+        conteos = self.contar_tareas_por_estado()
+        tareas_pendientes = conteos[EstadoTarea.PENDIENTE.value]
+        tareas_en_progreso = conteos[EstadoTarea.EN_PROGRESO.value]
+        tareas_completadas = conteos[EstadoTarea.COMPLETADA.value]
 
         # Calcular métricas adicionales
-        total_tareas = len(self.tareas)
+        total_tareas = self.contar_tareas()
         porcentaje_completadas = (
-            (len(tareas_completadas) / total_tareas * 100) if total_tareas > 0 else 0
+            (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0
         )
 
-        tareas_vencidas = [t for t in self.tareas if t.esta_vencida()]
+        # Vencidas y próximas a vencer (3 días) con búsquedas binarias sobre el
+        # índice por fecha límite, con una única lectura del reloj
+        ahora = datetime.now()
+        fechas, _ = self._obtener_indice_fecha()
+        tareas_vencidas = bisect_left(fechas, ahora)
+        tareas_proximas = (
+            bisect_left(fechas, ahora + timedelta(days=4)) - tareas_vencidas
+        )
 
         return {
             "total_usuarios": len(self.usuarios),
-            "usuarios_activos": len(usuarios_activos),
+            "usuarios_activos": len(self.usuarios),
             "total_tareas": total_tareas,
-            "tareas_pendientes": len(tareas_pendientes),
-            "tareas_en_progreso": len(tareas_en_progreso),
-            "tareas_completadas": len(tareas_completadas),
+            "tareas_pendientes": tareas_pendientes,
+            "tareas_en_progreso": tareas_en_progreso,
+            "tareas_completadas": tareas_completadas,
             "porcentaje_completadas": round(porcentaje_completadas, 2),
-            "tareas_vencidas": len(tareas_vencidas),
-            "tareas_proximas_vencer": len(tareas_proximas),
-            "fecha_consulta": formatear_fecha_legible(datetime.now()),
+            "tareas_vencidas": tareas_vencidas,
+            "tareas_proximas_vencer": tareas_proximas,
+            "fecha_consulta": formatear_fecha_legible(ahora),
         }
 
     def buscar_tareas(self, termino: str) -> List[Tarea]:
@@ -665,15 +1066,45 @@ class GestorSistema:
             return []
 
         termino_lower = termino.lower().strip()
-        tareas_encontradas = []
 
-        for tarea in self.tareas:
-            if termino_lower in tarea.titulo.lower() or (
-                tarea.descripcion and termino_lower in tarea.descripcion.lower()
-            ):
-                tareas_encontradas.append(tarea)
+        # Comparar contra las versiones en minúsculas precalculadas en cada tarea
+        return self._buscar_con_cache(
+            "tareas",
+            termino_lower,
+            lambda t: [
+                tarea
+                for tarea in self.tareas
+                if t in tarea.titulo_lower or t in tarea.descripcion_lower
+            ],
+        )
+
+    def buscar_usuarios(self, termino: str) -> List[Usuario]:
+        """
+        Busca usuarios por término en nombre o email.
+
+        La comparación no distingue mayúsculas ni acentos ("garcia" encuentra
+        a "García").
+
+        Args:
+            termino (str): Término de búsqueda
 
-        return tareas_encontradas
+        Returns:
+            List[Usuario]: Lista de usuarios que coinciden
+        """
+        if not termino or not termino.strip():
+            return []
+
+        termino_normalizado = normalizar_para_busqueda(termino.strip())
+
+        return self._buscar_con_cache(
+            "usuarios",
+            termino_normalizado,
+            lambda t: [
+                usuario
+                for nombre, email, usuario in self._obtener_indice_busqueda_usuarios()
+                if t in nombre or t in email
+            ],
+        )
 
     def limpiar_tareas_vencidas(self) -> int:
         """
@@ -703,6 +1134,16 @@ class GestorSistema:
 
         return len(tareas_a_eliminar)
 
+    def reiniciar(self) -> None:
+        """
+        Elimina todos los usuarios y tareas en memoria.
+
+        Los archivos guardados no se modifican hasta el siguiente guardado.
+        """
+        self.usuarios.clear()
+        self.tareas.clear()
+        self._invalidar_indices()
+
     def __str__(self) -> str:
         """Representación en cadena del sistema."""
         stats = self.obtener_estadisticas_sistema()
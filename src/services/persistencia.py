@@ -13,7 +13,21 @@ import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Union, Tuple
 import shutil
-from pathlib import Path
+import stat
+
+# orjson es opcional: si está instalado se usa para acelerar el guardado JSON.
+# Para los datos del sistema (cadenas, enteros, booleanos y None) el contenido
+# equivale al de json.dump, pero no es idéntico en todos los casos: escribe 1e16
+# en lugar de 1e+16, guarda NaN/Infinity como null y rechaza enteros de más de
+# 64 bits (guardar_datos lo notifica con ValueError).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Tamaño del buffer de escritura para archivos binarios (1 MiB)
+TAMAÑO_BUFFER_BINARIO = 1 << 20
 
 
 class GestorArchivos:
@@ -137,8 +151,9 @@ class GestorArchivos:
                 'fecha_modificacion': datetime.fromtimestamp(stats.st_mtime),
                 'fecha_acceso': datetime.fromtimestamp(stats.st_atime),
                 'fecha_creacion': datetime.fromtimestamp(stats.st_ctime),
-                'es_archivo': os.path.isfile(ruta_archivo),
-                'es_directorio': os.path.isdir(ruta_archivo)
+                # Tipo derivado del mismo stat, sin consultas adicionales
+                'es_archivo': stat.S_ISREG(stats.st_mode),
+                'es_directorio': stat.S_ISDIR(stats.st_mode)
             }
         except FileNotFoundError:
             return {
@@ -196,11 +211,22 @@ class PersistenciaJSON:
             datos_json = self._preparar_datos_para_json(datos)
             
             # Escribir archivo JSON con formato legible
-            with open(ruta_archivo, 'w', encoding='utf-8') as archivo:
-                json.dump(datos_json, archivo, 
-                         indent=2, 
-                         ensure_ascii=False,
-                         default=str)  # Convertir objetos no serializables a string
+            if orjson is not None:
+                contenido = orjson.dumps(
+                    datos_json,
+                    default=str,  # Convertir objetos no serializables a string
+                    option=(orjson.OPT_INDENT_2
+                            | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_PASSTHROUGH_DATETIME)
+                )
+                with open(ruta_archivo, 'wb') as archivo:
+                    archivo.write(contenido)
+            else:
+                with open(ruta_archivo, 'w', encoding='utf-8') as archivo:
+                    json.dump(datos_json, archivo, 
+                             indent=2, 
+                             ensure_ascii=False,
+                             default=str)  # Convertir objetos no serializables a string
             
             print(f"💾 Datos guardados en JSON: {ruta_archivo}")
             return True
@@ -226,8 +252,12 @@ class PersistenciaJSON:
         ruta_archivo = self.gestor.obtener_ruta_json(nombre_archivo)
         
         try:
-            with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
-                datos = json.load(archivo)
+            if orjson is not None:
+                with open(ruta_archivo, 'rb') as archivo:
+                    datos = orjson.loads(archivo.read())
+            else:
+                with open(ruta_archivo, 'r', encoding='utf-8') as archivo:
+                    datos = json.load(archivo)
             
             print(f"📖 Datos cargados desde JSON: {ruta_archivo}")
             return datos
@@ -308,8 +338,8 @@ class PersistenciaBinaria:
             if crear_backup and os.path.exists(ruta_archivo):
                 self._crear_backup(ruta_archivo, nombre_archivo)
             
-            # Guardar usando pickle
-            with open(ruta_archivo, 'wb') as archivo:
+            # Guardar usando pickle con un buffer amplio para reducir escrituras
+            with open(ruta_archivo, 'wb', buffering=TAMAÑO_BUFFER_BINARIO) as archivo:
                 pickle.dump(datos, archivo, protocol=protocolo)
             
             print(f"💾 Datos guardados en binario: {ruta_archivo}")
@@ -534,35 +564,39 @@ class GestorPersistencia:
         }
         
         try:
-            # Contar backups
-            if os.path.exists(self.gestor_archivos.directorio_backups):
-                backups = os.listdir(self.gestor_archivos.directorio_backups)
-                estadisticas['backups_totales'] = len(backups)
+            directorio_backups = self.gestor_archivos.directorio_backups
+            tamaño_total = 0
+            
+            # Un solo recorrido con os.scandir por directorio: los backups se
+            # cuentan, se fechan y se miden en la misma pasada
+            for directorio in (self.gestor_archivos.directorio_json,
+                               self.gestor_archivos.directorio_binarios,
+                               directorio_backups):
+                if not os.path.isdir(directorio):
+                    continue
+                
+                es_backups = directorio == directorio_backups
+                fechas_backup = []
+                with os.scandir(directorio) as entradas:
+                    for entrada in entradas:
+                        try:
+                            info = entrada.stat()
+                        except FileNotFoundError:
+                            continue  # Eliminado o enlace roto
+                        if entrada.is_file():
+                            tamaño_total += info.st_size
+                        if es_backups:
+                            fechas_backup.append(info.st_mtime)
                 
-                # Encontrar fecha del último backup
-                if backups:
-                    fechas_backup = []
-                    for backup in backups:
-                        ruta_backup = os.path.join(self.gestor_archivos.directorio_backups, backup)
-                        info = self.gestor_archivos.obtener_info_archivo(ruta_backup)
-                        if info['existe']:
-                            fechas_backup.append(info['fecha_modificacion'])
-                    
+                if es_backups:
+                    estadisticas['backups_totales'] = len(fechas_backup)
                     if fechas_backup:
-                        estadisticas['fecha_ultimo_backup'] = max(fechas_backup)
-            
-            # Calcular tamaño total
-            for directorio in [self.gestor_archivos.directorio_json,
-                              self.gestor_archivos.directorio_binarios,
-                              self.gestor_archivos.directorio_backups]:
-                if os.path.exists(directorio):
-                    for archivo in os.listdir(directorio):
-                        ruta_completa = os.path.join(directorio, archivo)
-                        if os.path.isfile(ruta_completa):
-                            estadisticas['tamaño_total_mb'] += os.path.getsize(ruta_completa)
+                        estadisticas['fecha_ultimo_backup'] = datetime.fromtimestamp(
+                            max(fechas_backup)
+                        )
             
             # Convertir bytes a MB
-            estadisticas['tamaño_total_mb'] = round(estadisticas['tamaño_total_mb'] / (1024 * 1024), 2)
+            estadisticas['tamaño_total_mb'] = round(tamaño_total / (1024 * 1024), 2)
             
         except Exception as e:
             print(f"⚠️ Error al calcular estadísticas: {e}")
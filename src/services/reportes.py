@@ -7,9 +7,11 @@ de datos del sistema.
 """
 
 import calendar
+import csv
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Generator
-from tabulate import tabulate
 
 # Importaciones locales
 try:
@@ -36,6 +38,18 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=None)
+def _obtener_tabulate():
+    """Importa tabulate solo cuando se genera el primer reporte."""
+    from tabulate import tabulate as _tabulate
+    return _tabulate
+
+
+def tabulate(*args, **kwargs) -> str:
+    """Genera una tabla con tabulate, importando la librería de forma diferida."""
+    return _obtener_tabulate()(*args, **kwargs)
+
+
 class GeneradorReportes:
     """
     Clase principal para generar reportes y estadísticas del sistema.
@@ -143,9 +157,10 @@ class GeneradorReportes:
         datos_tabla = []
         headers = ["ID", "Título", "Estado", "Asignado a", "Días Restantes", "Fecha Límite", "Creación"]
         
+        ahora = datetime.now()
         for tarea in tareas_filtradas:
             nombre_usuario = usuarios_dict.get(tarea.usuario_id, "Sin asignar")
-            dias_restantes = tarea.calcular_dias_restantes()
+            dias_restantes = tarea.calcular_dias_restantes(ahora)
             
             # Formatear días restantes con colores conceptuales
             if dias_restantes < 0:
@@ -180,7 +195,7 @@ class GeneradorReportes:
         
         # Calcular estadísticas
         total_tareas = len(tareas_filtradas)
-        tareas_vencidas = sum(1 for t in tareas_filtradas if t.esta_vencida())
+        tareas_vencidas = sum(1 for t in tareas_filtradas if t.esta_vencida(ahora))
         duracion_promedio = sum(t.obtener_duracion_estimada() for t in tareas_filtradas) / total_tareas if total_tareas > 0 else 0
         
         reporte = f"""
@@ -193,7 +208,7 @@ class GeneradorReportes:
 • Total de tareas: {total_tareas}
 • Tareas vencidas: {tareas_vencidas}
 • Duración promedio: {formatear_duracion(int(duracion_promedio * 24 * 60))}
-• Fecha de generación: {formatear_fecha_legible(datetime.now())}
+• Fecha de generación: {formatear_fecha_legible(ahora)}
 
 """
         return reporte
@@ -264,7 +279,7 @@ class GeneradorReportes:
         ahora = datetime.now()
         tareas_criticas = [
             t for t in tareas 
-            if t.calcular_dias_restantes() <= 2 and t.estado != EstadoTarea.COMPLETADA
+            if t.calcular_dias_restantes(ahora) <= 2 and t.estado != EstadoTarea.COMPLETADA
         ]
         
         tabla_criticas = ""
@@ -272,7 +287,7 @@ class GeneradorReportes:
             datos_criticas = []
             for tarea in tareas_criticas[:5]:  # Solo las primeras 5
                 nombre_usuario = usuarios_dict.get(tarea.usuario_id, "Sin asignar")
-                dias = tarea.calcular_dias_restantes()
+                dias = tarea.calcular_dias_restantes(ahora)
                 urgencia = "🔥 VENCIDA" if dias < 0 else f"⚡ {dias} día{'s' if dias != 1 else ''}"
                 
                 datos_criticas.append([
@@ -308,8 +323,8 @@ class GeneradorReportes:
 🔥 TAREAS CRÍTICAS (Vencidas o próximas a vencer):
 {tabla_criticas}
 
-📅 Fecha de generación: {formatear_fecha_legible(datetime.now())}
-🕒 Hora de generación: {datetime.now().strftime('%H:%M:%S')}
+📅 Fecha de generación: {formatear_fecha_legible(ahora)}
+🕒 Hora de generación: {ahora.strftime('%H:%M:%S')}
 
 """
         return dashboard
@@ -499,9 +514,6 @@ class GeneradorReportes:
         Returns:
             str: Mensaje de confirmación con la ruta del archivo
         """
-        import csv
-        import os
-        
         if not datos:
             return "No hay datos para exportar."
         
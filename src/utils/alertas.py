@@ -29,12 +29,13 @@ class SistemaAlertas:
             List[str]: Lista de mensajes de alerta formateados
         """
         alertas = []
+        ahora = datetime.now()
 
         # 1. Tareas vencidas
         tareas_vencidas = [
             t
             for t in gestor.tareas
-            if t.esta_vencida() and t.estado.value != "completada"
+            if t.esta_vencida(ahora) and t.estado.value != "completada"
         ]
         if tareas_vencidas:
             alertas.append(
@@ -98,13 +99,14 @@ class SistemaAlertas:
     @staticmethod
     def _obtener_tareas_proximas(tareas, dias: int) -> List:
         """Obtiene tareas que vencen en los próximos N días."""
-        fecha_limite = datetime.now() + timedelta(days=dias)
+        ahora = datetime.now()
+        fecha_limite = ahora + timedelta(days=dias)
         return [
             t
             for t in tareas
             if t.fecha_limite
             and t.fecha_limite <= fecha_limite
-            and not t.esta_vencida()
+            and not t.esta_vencida(ahora)
             and t.estado.value != "completada"
         ]
 
@@ -171,7 +173,10 @@ def obtener_alertas_criticas(gestor) -> int:
     Returns:
         int: Número de alertas críticas
     """
+    ahora = datetime.now()
     tareas_vencidas = [
-        t for t in gestor.tareas if t.esta_vencida() and t.estado.value != "completada"
+        t
+        for t in gestor.tareas
+        if t.esta_vencida(ahora) and t.estado.value != "completada"
     ]
     return len(tareas_vencidas)
@@ -8,11 +8,23 @@ nativos de Python.
 
 import re
 import calendar
+import unicodedata
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
 
+# Palabras comunes (stop words básicas) excluidas de las palabras clave
+_PALABRAS_COMUNES = frozenset({
+    'de', 'del', 'la', 'el', 'en', 'con', 'por', 'para', 'que', 'se',
+    'y', 'o', 'un', 'una', 'es', 'son', 'como', 'muy', 'mas', 'pero',
+    'web', 'las', 'los', 'te', 'le', 'lo', 'me', 'su', 'sus'
+})
+
+# Tabla de traducción que reemplaza la puntuación básica por espacios
+_TABLA_PUNTUACION = str.maketrans(dict.fromkeys(".,;:!?()¡¿[]{}\"'»«", " "))
+
+
 class TipoFormato(Enum):
     """Tipos de formato disponibles para diferentes tipos de datos."""
     TITULO = "titulo"
@@ -178,11 +190,7 @@ def limpiar_descripcion(descripcion: str, max_lineas: int = 10) -> str:
     lineas = descripcion.split('\n')
     
     # Limpiar cada línea y filtrar vacías
-    lineas_limpias = []
-    for linea in lineas:
-        linea_limpia = linea.strip()
-        if linea_limpia:  # Solo agregar líneas no vacías
-            lineas_limpias.append(linea_limpia)
+    lineas_limpias = [linea for linea in map(str.strip, lineas) if linea]
     
     # Limitar número de líneas usando slicing de listas
     if len(lineas_limpias) > max_lineas:
@@ -244,40 +252,35 @@ def extraer_palabras_clave(texto: str, min_longitud: int = 3) -> List[str]:
     if not texto:
         return []
     
-    # Lista de palabras comunes a filtrar (stop words básicas)
-    palabras_comunes = {
-        'de', 'del', 'la', 'el', 'en', 'con', 'por', 'para', 'que', 'se', 
-        'y', 'o', 'un', 'una', 'es', 'son', 'como', 'muy', 'mas', 'pero',
-        'web', 'las', 'los', 'del', 'te', 'le', 'lo', 'me', 'su', 'sus'
-    }
+    # Normalizar a minúsculas y sustituir la puntuación en una sola pasada
+    palabras = texto.lower().translate(_TABLA_PUNTUACION).split()
     
-    # Limpiar y normalizar usando métodos de cadenas
-    texto_limpio = texto.lower().strip()
+    # Filtrar y eliminar duplicados manteniendo el orden con dict.fromkeys()
+    return list(dict.fromkeys(
+        palabra
+        for palabra in palabras
+        if len(palabra) >= min_longitud and palabra not in _PALABRAS_COMUNES
+    ))
+
+
+def normalizar_para_busqueda(texto: str) -> str:
+    """
+    Normaliza un texto para comparaciones sin distinguir mayúsculas ni acentos.
     
-    # Remover puntuación básica usando replace()
-    puntuacion = ".,;:!?()¡¿[]{}\"'»«"
-    for char in puntuacion:
-        texto_limpio = texto_limpio.replace(char, ' ')
+    Descompone los caracteres (NFKD), elimina las marcas diacríticas y aplica
+    casefold(), de modo que "García" y "garcia" producen el mismo resultado.
     
-    # Dividir en palabras usando split()
-    palabras = texto_limpio.split()
-    
-    # Filtrar palabras usando list comprehension y métodos de cadenas
-    palabras_validas = [
-        palabra.strip() 
-        for palabra in palabras 
-        if (palabra.strip() and 
-            len(palabra.strip()) >= min_longitud and
-            palabra.strip() not in palabras_comunes)
-    ]
-    
-    # Eliminar duplicados manteniendo orden usando set y métodos de listas
-    palabras_unicas = []
-    for palabra in palabras_validas:
-        if palabra not in palabras_unicas:
-            palabras_unicas.append(palabra)
-    
-    return palabras_unicas
+    Args:
+        texto (str): Texto a normalizar
+        
+    Returns:
+        str: Texto normalizado
+    """
+    if texto.isascii():
+        return texto.casefold()
+    
+    descompuesto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
 
 
 def crear_resumen_texto(texto: str, max_palabras: int = 20) -> str:
@@ -6,10 +6,16 @@ y usuarios, optimizando el uso de memoria y proporcionando funcionalidades
 de filtrado y transformación.
 """
 
+from collections import Counter
+from operator import attrgetter
 from typing import Iterator, List, Generator, Optional, Callable, Any, Dict
 from datetime import datetime, timedelta
 
 
+# Extrae el valor textual del estado de una tarea
+_valor_estado = attrgetter('estado.value')
+
+
 class IteradorTareas:
     """
     Iterador personalizado para recorrer colecciones de tareas.
@@ -97,8 +103,9 @@ def generador_tareas_vencidas(tareas: List[Any]) -> Generator[Any, None, None]:
     Yields:
         Any: Tareas que están vencidas
     """
+    ahora = datetime.now()
     for tarea in tareas:
-        if hasattr(tarea, 'esta_vencida') and tarea.esta_vencida():
+        if hasattr(tarea, 'esta_vencida') and tarea.esta_vencida(ahora):
             yield tarea
 
 
@@ -113,9 +120,10 @@ def generador_tareas_proximas_vencer(tareas: List[Any], dias: int = 3) -> Genera
     Yields:
         Any: Tareas próximas a vencer
     """
+    ahora = datetime.now()
     for tarea in tareas:
         if hasattr(tarea, 'calcular_dias_restantes'):
-            dias_restantes = tarea.calcular_dias_restantes()
+            dias_restantes = tarea.calcular_dias_restantes(ahora)
             if 0 <= dias_restantes <= dias:
                 yield tarea
 
@@ -139,9 +147,10 @@ def generador_estadisticas_por_lote(tareas: List[Any], tamaño_lote: int = 10) -
         
         # Calcular estadísticas del lote usando métodos de listas
         total_tareas = len(lote)
-        pendientes = sum(1 for t in lote if hasattr(t, 'estado') and t.estado.value == 'pendiente')
-        en_progreso = sum(1 for t in lote if hasattr(t, 'estado') and t.estado.value == 'en_progreso')
-        completadas = sum(1 for t in lote if hasattr(t, 'estado') and t.estado.value == 'completada')
+        conteos = Counter(map(_valor_estado, lote))
+        pendientes = conteos['pendiente']
+        en_progreso = conteos['en_progreso']
+        completadas = conteos['completada']
         
         yield {
             'lote_numero': (i // tamaño_lote) + 1,
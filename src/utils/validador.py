@@ -5,6 +5,7 @@ Este módulo proporciona validaciones robustas para garantizar la integridad
 de los datos antes de que sean procesados o guardados en el sistema.
 """
 
+import json
 import re
 from datetime import datetime
 from enum import Enum
@@ -158,11 +159,12 @@ class ValidadorDatos:
                 f"Prioridad inválida. Debe ser una de: {', '.join(prioridades_validas)}"
             )
 
-        # Validar fechas
+        # Validar fechas (una sola lectura del reloj para ambas comprobaciones)
+        ahora = datetime.now()
         try:
             if data.get("fecha_creacion"):
                 fecha_creacion = datetime.fromisoformat(data["fecha_creacion"])
-                if fecha_creacion > datetime.now():
+                if fecha_creacion > ahora:
                     resultado.agregar_advertencia("La fecha de creación es futura")
         except (ValueError, TypeError):
             resultado.agregar_error("Formato de fecha de creación inválido")
@@ -171,7 +173,7 @@ class ValidadorDatos:
             if data.get("fecha_limite"):
                 fecha_limite = datetime.fromisoformat(data["fecha_limite"])
                 # Para datos cargados, solo advertir sobre fechas pasadas
-                if fecha_limite < datetime.now():
+                if fecha_limite < ahora:
                     resultado.agregar_advertencia("La fecha límite está en el pasado")
         except (ValueError, TypeError):
             resultado.agregar_error("Formato de fecha límite inválido")
@@ -277,8 +279,6 @@ class ValidadorDatos:
 
         # Validar que los datos se pueden serializar
         try:
-            import json
-
             datos_prueba = {
                 "usuarios": [
                     u.to_dict() if hasattr(u, "to_dict") else str(u)
@@ -0,0 +1,63 @@
+"""
+Pruebas unitarias para las utilidades del CLI.
+
+Este módulo contiene las pruebas de las funciones auxiliares de
+cli_utils que no requieren interacción con el usuario.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Agregar el directorio src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cli.cli_utils import (
+    CLIColors, _parse_ddmmyyyy, calcular_dias_restantes, formatear_fecha_legible
+)
+
+
+class TestParseFecha:
+    """Pruebas para el parser rápido de fechas DD/MM/YYYY."""
+
+    @pytest.mark.parametrize("texto", ["25/12/2025", "5/3/2030", "05/03/2030", "29/02/2028"])
+    def test_coincide_con_strptime(self, texto):
+        """Prueba que las fechas válidas se interpretan igual que con strptime."""
+        assert _parse_ddmmyyyy(texto) == datetime.strptime(texto, "%d/%m/%Y")
+
+    @pytest.mark.parametrize(
+        "texto", ["31/02/2025", "25/12/25", "2025/12/25", "25-12-2025", "aa/bb/cccc", "+1/12/2025", ""]
+    )
+    def test_entradas_no_validas(self, texto):
+        """Prueba que las entradas no estrictas devuelven None."""
+        assert _parse_ddmmyyyy(texto) is None
+
+
+class TestFechaLegible:
+    """Pruebas para el formateo legible de fechas."""
+
+    def test_formato(self):
+        """Prueba el texto generado, que ignora la hora."""
+        assert formatear_fecha_legible(datetime(2025, 12, 1)) == "1 de diciembre de 2025"
+        assert formatear_fecha_legible(datetime(2025, 12, 1, 23, 59)) == "1 de diciembre de 2025"
+        assert formatear_fecha_legible(datetime(2026, 1, 31)) == "31 de enero de 2026"
+
+
+class TestDiasRestantes:
+    """Pruebas para el cálculo de días restantes de la tabla de tareas."""
+
+    def test_clasificacion(self):
+        """Prueba la clasificación en vencida, crítica y normal."""
+        ahora = datetime(2025, 6, 1, 12, 0)
+
+        assert calcular_dias_restantes(ahora - timedelta(days=2), ahora) == (-2, True, CLIColors.ERROR)
+        assert calcular_dias_restantes(ahora + timedelta(days=3), ahora) == (3, True, CLIColors.WARNING)
+        assert calcular_dias_restantes(ahora + timedelta(days=10), ahora) == (10, False, CLIColors.SUCCESS)
+
+    def test_mismo_calculo_que_la_tarea(self):
+        """Prueba que cuenta los días igual que Tarea.calcular_dias_restantes."""
+        ahora = datetime(2025, 6, 1, 15, 0)
+        fecha_limite = datetime(2025, 6, 2)
+
+        assert calcular_dias_restantes(fecha_limite, ahora)[0] == (fecha_limite - ahora).days == 0
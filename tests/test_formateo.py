@@ -17,7 +17,8 @@ from utils.formateo import (
     formatear_titulo, formatear_nombre_completo, validar_y_formatear_email,
     limpiar_descripcion, formatear_lista_elementos, extraer_palabras_clave,
     crear_resumen_texto, formatear_fecha_legible, formatear_duracion,
-    organizar_datos_por_categoria, generar_calendario_texto, TipoFormato
+    organizar_datos_por_categoria, generar_calendario_texto, TipoFormato,
+    normalizar_para_busqueda
 )
 
 
@@ -248,6 +249,22 @@ class TestResumenTexto:
         assert crear_resumen_texto("") == ""
 
 
+class TestNormalizacionBusqueda:
+    """Pruebas para normalización de texto de búsqueda."""
+    
+    def test_normalizar_acentos_y_mayusculas(self):
+        """Prueba la normalización sin mayúsculas ni acentos."""
+        assert normalizar_para_busqueda("José GARCÍA Núñez") == "jose garcia nunez"
+    
+    def test_normalizar_texto_ascii(self):
+        """Prueba la normalización de texto ASCII."""
+        assert normalizar_para_busqueda("Ana@Empresa.com") == "ana@empresa.com"
+    
+    def test_normalizar_texto_vacio(self):
+        """Prueba la normalización de texto vacío."""
+        assert normalizar_para_busqueda("") == ""
+
+
 class TestFormateoFecha:
     """Pruebas para formateo de fechas."""
     
@@ -161,6 +161,64 @@ class TestGestorSistema(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "json", "usuarios.json")))
         self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "json", "tareas.json")))
     
+    def test_recargar_datos_guardados(self):
+        """Test de carga de los datos guardados en JSON."""
+        usuario = self.gestor.crear_usuario("Usuario Test", "test@empresa.com")
+        fecha_futura = datetime.now() + timedelta(days=7)
+        self.gestor.crear_tarea("Tarea Test", "Descripción", fecha_futura, usuario.email)
+        self.assertTrue(self.gestor.guardar_datos_sistema("json"))
+        
+        gestor_recargado = GestorSistema(directorio_datos=self.temp_dir)
+        
+        self.assertEqual(len(gestor_recargado.usuarios), 1)
+        self.assertEqual(len(gestor_recargado.tareas), 1)
+        self.assertEqual(gestor_recargado.tareas[0].titulo, "Tarea Test")
+        self.assertEqual(gestor_recargado.tareas[0].usuario_id, usuario.id)
+    
+    def test_estadisticas_almacenamiento(self):
+        """Test de las estadísticas de archivos y backups."""
+        self.gestor.crear_usuario("Usuario Test", "test@empresa.com")
+        self.gestor.guardar_datos_sistema("todos")
+        # El segundo guardado crea backups de los archivos existentes
+        self.gestor.guardar_datos_sistema("todos")
+        
+        stats = self.gestor.persistencia.obtener_estadisticas_almacenamiento()
+        
+        self.assertEqual(stats['archivos_json'], 2)
+        self.assertEqual(stats['archivos_binarios'], 2)
+        self.assertEqual(stats['backups_totales'], 4)
+        self.assertIsInstance(stats['fecha_ultimo_backup'], datetime)
+        self.assertGreaterEqual(stats['tamaño_total_mb'], 0)
+    
+    def test_obtener_info_archivo(self):
+        """Test de la información de archivos y directorios."""
+        self.gestor.guardar_datos_sistema("json")
+        archivos = self.gestor.persistencia.gestor_archivos
+        
+        info_archivo = archivos.obtener_info_archivo(archivos.obtener_ruta_json("usuarios"))
+        info_directorio = archivos.obtener_info_archivo(archivos.directorio_json)
+        info_inexistente = archivos.obtener_info_archivo(os.path.join(self.temp_dir, "nada"))
+        
+        self.assertTrue(info_archivo['existe'])
+        self.assertTrue(info_archivo['es_archivo'])
+        self.assertFalse(info_archivo['es_directorio'])
+        self.assertTrue(info_directorio['es_directorio'])
+        self.assertFalse(info_inexistente['existe'])
+    
+    def test_guardar_datos_sistema_todos_formatos(self):
+        """Test de guardado simultáneo en JSON y binario."""
+        self.gestor.crear_usuario("Usuario Test", "test@empresa.com")
+        
+        resultado = self.gestor.guardar_datos_sistema("todos")
+        self.assertTrue(resultado)
+        
+        persistencia = self.gestor.persistencia.gestor_archivos
+        for nombre in ("usuarios", "tareas"):
+            self.assertTrue(os.path.exists(persistencia.obtener_ruta_json(nombre)))
+            self.assertTrue(os.path.exists(persistencia.obtener_ruta_binario(nombre)))
+        
+        self.assertFalse(self.gestor.guardar_datos_sistema("xml"))
+    
     def test_generar_reporte_usuarios(self):
         """Test de generación de reporte de usuarios."""
         self.gestor.crear_usuario("Ana García", "ana@empresa.com")
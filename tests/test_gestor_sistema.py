@@ -179,3 +179,196 @@ class TestGestorSistema(unittest.TestCase):
         self.assertIsNotNone(tarea)
         self.assertEqual(tarea.usuario_id, usuario.id)
         self.assertIn(tarea.id, usuario.tareas_asignadas)
+    
+    # ===============================
+    # TESTS DE ÍNDICES EN MEMORIA
+    # ===============================
+    
+    def test_contar_tareas_por_estado_tras_eliminar(self):
+        """Test de invalidación del índice al eliminar tareas."""
+        fecha_futura = datetime.now() + timedelta(days=7)
+        tarea = self.gestor.crear_tarea("Tarea", "Descripción", fecha_futura)
+        self.assertEqual(self.gestor.contar_tareas_por_estado()["pendiente"], 1)
+        
+        self.gestor.eliminar_tarea(tarea.id)
+        
+        self.assertEqual(self.gestor.contar_tareas_por_estado()["pendiente"], 0)
+    
+    def test_listar_tareas_por_prioridad_y_usuario(self):
+        """Test de los filtros por prioridad y usuario basados en índices."""
+        fecha_futura = datetime.now() + timedelta(days=7)
+        usuario = self.gestor.crear_usuario("Ana García", "ana@empresa.com")
+        tarea1 = self.gestor.crear_tarea("Tarea 1", "Descripción", fecha_futura, usuario.email)
+        tarea2 = self.gestor.crear_tarea("Tarea 2", "Descripción", fecha_futura)
+        
+        self.assertEqual(list(self.gestor.listar_tareas_por_prioridad("baja")), [tarea1, tarea2])
+        self.assertEqual(list(self.gestor.listar_tareas_por_prioridad("alta")), [])
+        self.assertEqual(list(self.gestor.listar_tareas_por_usuario(usuario.id)), [tarea1])
+        
+        # Los índices se invalidan al actualizar y al asignar tareas
+        tarea2.prioridad = "alta"
+        self.gestor.actualizar_tarea(tarea2)
+        self.gestor.asignar_tarea(tarea2.id, usuario.email)
+        
+        self.assertEqual(list(self.gestor.listar_tareas_por_prioridad("alta")), [tarea2])
+        self.assertEqual(list(self.gestor.listar_tareas_por_usuario(usuario.id)), [tarea1, tarea2])
+    
+    def test_tareas_vencidas_y_proximas_por_fecha(self):
+        """Test de las consultas por rango de fecha límite."""
+        ahora = datetime.now()
+        en_cinco = self.gestor.crear_tarea("En cinco días", "Descripción", ahora + timedelta(days=5))
+        en_uno = self.gestor.crear_tarea("En un día", "Descripción", ahora + timedelta(days=1))
+        lejana = self.gestor.crear_tarea("Lejana", "Descripción", ahora + timedelta(days=30))
+        self.gestor.crear_tarea("Sin fecha", "Descripción", None)
+        
+        # Las tareas próximas salen ordenadas por fecha límite
+        self.assertEqual(list(self.gestor.obtener_tareas_proximas_vencer(7)), [en_uno, en_cinco])
+        self.assertEqual(list(self.gestor.obtener_tareas_proximas_vencer(3)), [en_uno])
+        
+        # Vista desde dentro de diez días; las completadas no cuentan
+        futuro = ahora + timedelta(days=10)
+        self.assertEqual(list(self.gestor.obtener_tareas_vencidas(futuro)), [en_uno, en_cinco])
+        self.gestor.cambiar_estado_tarea(en_uno.id, "completada")
+        self.assertEqual(list(self.gestor.obtener_tareas_vencidas(futuro)), [en_cinco])
+        self.assertNotIn(lejana, self.gestor.obtener_tareas_vencidas(futuro))
+    
+    def test_contar_tareas_por_estado(self):
+        """Test de los conteos por estado totales y por usuario."""
+        fecha_futura = datetime.now() + timedelta(days=7)
+        usuario = self.gestor.crear_usuario("Ana García", "ana@empresa.com")
+        tarea1 = self.gestor.crear_tarea("Tarea 1", "Descripción", fecha_futura, usuario.email)
+        self.gestor.crear_tarea("Tarea 2", "Descripción", fecha_futura, usuario.email)
+        self.gestor.crear_tarea("Tarea 3", "Descripción", fecha_futura)
+        
+        self.assertEqual(self.gestor.contar_tareas_por_estado()["pendiente"], 3)
+        self.assertEqual(self.gestor.contar_tareas_por_estado(usuario.id)["pendiente"], 2)
+        self.assertEqual(self.gestor.contar_tareas_por_estado(None)["pendiente"], 1)
+        self.assertEqual(self.gestor.contar_tareas_por_estado("inexistente"), {})
+        
+        # Los conteos se invalidan al cambiar el estado
+        self.gestor.cambiar_estado_tarea(tarea1.id, "completada")
+        conteo = self.gestor.contar_tareas_por_estado(usuario.id)
+        self.assertEqual((conteo["pendiente"], conteo["completada"]), (1, 1))
+    
+    def test_contar_tareas(self):
+        """Test del conteo total de tareas."""
+        self.assertEqual(self.gestor.contar_tareas(), 0)
+        
+        fecha_futura = datetime.now() + timedelta(days=7)
+        self.gestor.crear_tarea("Tarea", "Descripción", fecha_futura)
+        
+        self.assertEqual(self.gestor.contar_tareas(), 1)
+        self.assertEqual(self.gestor.buscar_tareas(""), [])
+    
+    def test_listar_todas_tareas(self):
+        """Test de la enumeración de todas las tareas."""
+        fecha_futura = datetime.now() + timedelta(days=7)
+        self.gestor.crear_tarea("Tarea 1", "Descripción", fecha_futura)
+        self.gestor.crear_tarea("Tarea 2", "Descripción", fecha_futura)
+        
+        self.assertEqual(sum(1 for _ in self.gestor.listar_todas_tareas()), 2)
+        self.assertEqual(list(self.gestor.listar_todas_tareas()), self.gestor.tareas)
+    
+    def test_buscar_usuarios(self):
+        """Test de búsqueda de usuarios por nombre o email."""
+        ana = self.gestor.crear_usuario("Ana García", "ana@empresa.com")
+        self.gestor.crear_usuario("Luis Pérez", "luis@otra.com")
+        
+        self.assertEqual(self.gestor.buscar_usuarios("GARC"), [ana])
+        self.assertEqual(len(self.gestor.buscar_usuarios("empresa")), 1)
+        self.assertEqual(self.gestor.buscar_usuarios("  "), [])
+        
+        # El índice se invalida al crear y al actualizar usuarios
+        eva = self.gestor.crear_usuario("Eva Ruiz", "eva@empresa.com")
+        self.assertEqual(self.gestor.buscar_usuarios("empresa"), [ana, eva])
+        
+        eva.nombre = "Eva Martín"
+        self.assertTrue(self.gestor.actualizar_usuario(eva))
+        self.assertEqual(self.gestor.buscar_usuarios("martín"), [eva])
+        
+        # Sin distinguir acentos en ninguno de los dos sentidos
+        self.assertEqual(self.gestor.buscar_usuarios("martin"), [eva])
+        self.assertEqual(self.gestor.buscar_usuarios("GARCÍA"), [ana])
+    
+    def test_cache_de_busquedas(self):
+        """Test de la caché de búsquedas y su invalidación."""
+        fecha_futura = datetime.now() + timedelta(days=7)
+        tarea = self.gestor.crear_tarea("Revisar API", "Descripción", fecha_futura)
+        
+        resultados = self.gestor.buscar_tareas("api")
+        self.assertEqual(resultados, [tarea])
+        
+        # Modificar la lista devuelta no altera la caché
+        resultados.clear()
+        self.assertEqual(self.gestor.buscar_tareas("API"), [tarea])
+        
+        # Crear una tarea invalida la caché
+        otra = self.gestor.crear_tarea("Documentar API", "Descripción", fecha_futura)
+        self.assertEqual(self.gestor.buscar_tareas("api"), [tarea, otra])
+    
+    def test_crear_usuarios_bulk(self):
+        """Test de creación de varios usuarios en una sola operación."""
+        self.gestor.crear_usuario("Ana García", "ana@empresa.com")
+        
+        usuarios = self.gestor.crear_usuarios_bulk([
+            ("Luis Pérez", "luis@empresa.com"),
+            ("Eva Ruiz", "eva@empresa.com"),
+            ("Ana Duplicada", "ANA@empresa.com"),
+            ("Luis Repetido", "luis@empresa.com"),
+            ("", "vacio@empresa.com"),
+            ("Email Inválido", "no-es-email"),
+        ])
+        
+        self.assertEqual(len(usuarios), 2)
+        self.assertEqual([u.email for u in usuarios], ["luis@empresa.com", "eva@empresa.com"])
+        self.assertEqual(len(self.gestor.usuarios), 3)
+    
+    def test_crear_tareas_bulk(self):
+        """Test de creación de varias tareas en una sola operación."""
+        usuario = self.gestor.crear_usuario("Ana García", "ana@empresa.com")
+        fecha_futura = datetime.now() + timedelta(days=7)
+        
+        tareas = self.gestor.crear_tareas_bulk([
+            ("Tarea 1", "Descripción", fecha_futura, "ana@empresa.com"),
+            ("Tarea 2", "Descripción", fecha_futura),
+            ("", "Título vacío", fecha_futura),
+            ("Tarea 3", "Usuario inexistente", fecha_futura, "nadie@empresa.com"),
+        ])
+        
+        self.assertEqual(len(tareas), 2)
+        self.assertEqual(self.gestor.contar_tareas(), 2)
+        self.assertEqual(tareas[0].usuario_id, usuario.id)
+        self.assertEqual(usuario.tareas_asignadas, [tareas[0].id])
+        self.assertEqual(self.gestor.contar_tareas_por_estado()["pendiente"], 2)
+    
+    def test_reiniciar(self):
+        """Test de que reiniciar vacía el sistema y sus índices."""
+        usuario = self.gestor.crear_usuario("Ana Pérez", "ana@email.com")
+        self.gestor.crear_tarea("Tarea", "Descripción", datetime.now() + timedelta(days=7), usuario.email)
+        self.assertEqual(self.gestor.contar_tareas_por_estado()['pendiente'], 1)
+        
+        self.gestor.reiniciar()
+        
+        self.assertEqual(self.gestor.usuarios, [])
+        self.assertEqual(self.gestor.tareas, [])
+        self.assertEqual(sum(self.gestor.contar_tareas_por_estado().values()), 0)
+        self.assertEqual(self.gestor.buscar_usuarios("ana"), [])
+    
+    def test_estadisticas_vencidas_y_proximas(self):
+        """Test del conteo de tareas vencidas y próximas a vencer."""
+        ahora = datetime.now()
+        vencida = self.gestor.crear_tarea("Vencida", "Descripción", ahora + timedelta(days=7))
+        self.gestor.crear_tarea("Próxima", "Descripción", ahora + timedelta(days=2, hours=1))
+        self.gestor.crear_tarea("Lejana", "Descripción", ahora + timedelta(days=30))
+        
+        # Construir el índice por fecha antes de cambiar la fecha límite
+        stats = self.gestor.obtener_estadisticas_sistema()
+        self.assertEqual(stats['tareas_vencidas'], 0)
+        
+        vencida.fecha_limite = ahora - timedelta(days=2)
+        self.assertTrue(self.gestor.actualizar_tarea(vencida))
+        
+        stats = self.gestor.obtener_estadisticas_sistema()
+        
+        self.assertEqual(stats['tareas_vencidas'], 1)
+        self.assertEqual(stats['tareas_proximas_vencer'], 1)
@@ -0,0 +1,87 @@
+"""
+Tests para la persistencia JSON.
+
+Fija las diferencias aceptadas entre el guardado con orjson (opcional)
+y el guardado con json de la biblioteca estándar.
+"""
+
+import unittest
+import os
+import json
+import math
+import tempfile
+import shutil
+import sys
+
+# Agregar el directorio src al path para importar módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services import persistencia
+from services.persistencia import GestorArchivos, PersistenciaJSON
+
+
+class BasePersistenciaJSON(unittest.TestCase):
+    """Configuración común para los tests de PersistenciaJSON."""
+    
+    def setUp(self):
+        """Configuración inicial para cada test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.gestor_archivos = GestorArchivos(self.temp_dir)
+        self.persistencia = PersistenciaJSON(self.gestor_archivos)
+    
+    def tearDown(self):
+        """Limpieza después de cada test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _leer_texto(self, nombre: str) -> str:
+        """Lee el contenido de un archivo JSON guardado."""
+        with open(self.gestor_archivos.obtener_ruta_json(nombre), encoding='utf-8') as archivo:
+            return archivo.read()
+
+
+class TestPersistenciaJSON(BasePersistenciaJSON):
+    """Tests para la clase PersistenciaJSON."""
+    
+    def test_guardar_y_cargar_datos_del_sistema(self):
+        """Test de ida y vuelta con datos como los del sistema."""
+        datos = {
+            "usuarios": [{"id": "u1", "nombre": "Ana Núñez", "telefono": None}],
+            "tareas": [{"titulo": "Revisión", "horas": 2.5, "activa": True, "control": "\x7f"}],
+        }
+        
+        self.assertTrue(self.persistencia.guardar_datos("datos", datos, crear_backup=False))
+        
+        self.assertEqual(self.persistencia.cargar_datos("datos"), datos)
+        self.assertEqual(
+            self._leer_texto("datos"),
+            json.dumps(datos, indent=2, ensure_ascii=False)
+        )
+
+
+@unittest.skipIf(persistencia.orjson is None, "orjson no está instalado")
+class TestDiferenciasOrjson(BasePersistenciaJSON):
+    """Tests que fijan las diferencias aceptadas del guardado con orjson."""
+    
+    def test_exponente_sin_signo(self):
+        """Test de que los flotantes grandes se escriben como 1e16."""
+        self.persistencia.guardar_datos("datos", {"valor": 1e16}, crear_backup=False)
+        
+        self.assertIn('"valor": 1e16', self._leer_texto("datos"))
+        self.assertEqual(self.persistencia.cargar_datos("datos"), {"valor": 1e16})
+    
+    def test_nan_se_guarda_como_null(self):
+        """Test de que NaN e infinito se guardan como null."""
+        self.persistencia.guardar_datos(
+            "datos", {"nan": math.nan, "inf": math.inf}, crear_backup=False
+        )
+        
+        self.assertEqual(self.persistencia.cargar_datos("datos"), {"nan": None, "inf": None})
+    
+    def test_entero_de_mas_de_64_bits(self):
+        """Test de que los enteros de más de 64 bits no se pueden guardar."""
+        with self.assertRaises(ValueError):
+            self.persistencia.guardar_datos("datos", {"valor": 2 ** 70}, crear_backup=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -177,6 +177,37 @@ class TestTarea:
         # Act & Assert
         assert tarea.esta_vencida() is True
     
+    def test_referencia_temporal_explicita(self):
+        """Prueba el cálculo con un momento de referencia proporcionado."""
+        # Arrange
+        tarea = Tarea(self.titulo, self.descripcion, self.fecha_futura)
+        referencia = tarea.fecha_limite - timedelta(days=3, hours=1)
+        
+        # Act & Assert
+        assert tarea.calcular_dias_restantes(referencia) == 3
+        assert tarea.esta_vencida(referencia) is False
+        assert tarea.esta_vencida(tarea.fecha_limite + timedelta(seconds=1)) is True
+    
+    def test_fecha_creacion_dia(self):
+        """Prueba que el día de creación sigue a fecha_creacion."""
+        # Arrange
+        tarea = Tarea(self.titulo, self.descripcion, self.fecha_futura)
+        
+        # Act & Assert
+        assert tarea.fecha_creacion_dia == tarea.fecha_creacion.date()
+        tarea.fecha_creacion = datetime(2024, 3, 15, 23, 59)
+        assert tarea.fecha_creacion_dia == datetime(2024, 3, 15).date()
+    
+    def test_titulo_corto(self):
+        """Prueba que el título recortado sigue al título."""
+        # Arrange
+        tarea = Tarea(self.titulo, self.descripcion, self.fecha_futura)
+        
+        # Act & Assert
+        assert tarea.titulo_corto == tarea.titulo[:30]
+        tarea.titulo = "X" * 45
+        assert tarea.titulo_corto == "X" * 30
+    
     def test_obtener_duracion_estimada(self):
         """Prueba obtener duración estimada."""
         # Arrange
@@ -324,3 +355,16 @@ class TestTarea:
         for titulo_original, titulo_esperado in titulos_prueba:
             tarea = Tarea(titulo_original, "descripción", self.fecha_futura)
             assert tarea.titulo == titulo_esperado
+    
+    def test_busqueda_minusculas_se_actualiza(self):
+        """Prueba que las versiones en minúsculas se actualizan al modificar la tarea."""
+        # Arrange
+        tarea = Tarea("Revisar Informe", "Datos DEL Trimestre", self.fecha_futura)
+        
+        # Act
+        tarea.titulo = "Enviar Correo"
+        tarea.descripcion = None
+        
+        # Assert
+        assert tarea.titulo_lower == "enviar correo"
+        assert tarea.descripcion_lower == ""